@@ -1,4 +1,5 @@
 import discord
+import logging
 from discord import app_commands
 from handlers.reminder_scheduler import ReminderScheduler
 from services.calendar_service import CalendarService
@@ -9,8 +10,11 @@ from services.reminder_manager import ReminderManager
 from db.user_manager import UserManager
 from utils.permission_manager import PermissionManager
 from utils.stats_module import StatsModule
+from utils.ratelimit import DiscordLimiter
 import os
-from handlers.bot_commands import register_all_commands
+from handlers.bot_commands import register_all_commands, invalidate_role_cache
+
+logger = logging.getLogger(__name__)
 
 class BotCore(discord.Client):
     def __init__(self, **kwargs):
@@ -27,6 +31,8 @@ class BotCore(discord.Client):
         self.rule_engine = RuleEngine()
         self.ai_planner_agent = AIPlannerAgent(openai_key=os.getenv('OPENAI_API_KEY', ''))
         self.owner_id = None
+        # Paces bulk Discord API work such as command syncs
+        self.rate_limiter = DiscordLimiter()
 
     async def setup_hook(self):
         """Called when the bot is starting up"""
@@ -64,56 +70,40 @@ class BotCore(discord.Client):
         # Start poll expiration checker
         self.loop.create_task(self.check_expired_polls())
 
+    async def on_guild_role_create(self, role):
+        invalidate_role_cache(role.guild.id)
+
+    async def on_guild_role_update(self, before, after):
+        invalidate_role_cache(after.guild.id)
+
+    async def on_guild_role_delete(self, role):
+        invalidate_role_cache(role.guild.id)
+
     async def on_raw_reaction_add(self, payload):
         """Handle reaction-based voting for polls"""
         # Ignore bot reactions
         if payload.user_id == self.user.id:
             return
 
-        # Get the message
-        channel = self.get_channel(payload.channel_id)
-        if not channel:
-            return
-
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except:
-            return
+        # Import here to avoid circular imports
+        from handlers.poll_commands import POLL_EMOJI_INDEX, apply_reaction_vote, poll_id_for_message
 
-        # Check if this is a poll message (contains poll ID in embed)
-        if not message.embeds:
-            return
-
-        embed = message.embeds[0]
-        if embed.title != "📊 Poll":
+        # Map emoji to option index; only the regional indicators 🇦 to 🇹 can be votes,
+        # so skip the poll lookup for anything else
+        emoji = str(payload.emoji)
+        option_index = POLL_EMOJI_INDEX.get(emoji)
+        if option_index is None:
             return
+        logger.debug("Detected reaction: %s -> option %s", emoji, option_index)
 
-        # Extract poll ID from embed
-        poll_id = None
-        for field in embed.fields:
-            if field.name == "Poll ID":
-                poll_id = field.value
-                break
-
+        # Polls store their message ID, so the vote resolves without fetching the message
+        poll_id = await poll_id_for_message(payload.message_id)
+        if not poll_id:
+            poll_id = await self._poll_id_from_message(payload)
         if not poll_id:
             return
 
-        # Map emoji to option index
-        emoji = str(payload.emoji)
-        option_index = None
-
-        # Handle regional indicator emojis (🇦 to 🇹)
-        # These are single unicode characters
-        if len(emoji) == 1:
-            char_code = ord(emoji)
-            if 0x1F1E6 <= char_code <= 0x1F1F9:  # 🇦 to 🇹 (20 emojis)
-                option_index = char_code - 0x1F1E6
-                print(f"Detected reaction: {emoji} -> option {option_index}")
-
-        if option_index is not None:
-            # Import here to avoid circular imports
-            from handlers.poll_commands import sync_reaction_votes
-            success = await sync_reaction_votes(poll_id, payload.user_id, message)
+        success = await apply_reaction_vote(poll_id, payload.user_id, option_index, True)
 
     async def on_raw_reaction_remove(self, payload):
         """Handle reaction removal for polls"""
@@ -121,23 +111,45 @@ class BotCore(discord.Client):
         if payload.user_id == self.user.id:
             return
 
+        # Import here to avoid circular imports
+        from handlers.poll_commands import POLL_EMOJI_INDEX, apply_reaction_vote, poll_id_for_message
+
+        # Map emoji to option index; only the regional indicators 🇦 to 🇹 can be votes,
+        # so skip the poll lookup for anything else
+        emoji = str(payload.emoji)
+        option_index = POLL_EMOJI_INDEX.get(emoji)
+        if option_index is None:
+            return
+        logger.debug("Removed reaction: %s -> option %s", emoji, option_index)
+
+        # Polls store their message ID, so the vote resolves without fetching the message
+        poll_id = await poll_id_for_message(payload.message_id)
+        if not poll_id:
+            poll_id = await self._poll_id_from_message(payload)
+        if not poll_id:
+            return
+
+        success = await apply_reaction_vote(poll_id, payload.user_id, option_index, False)
+
+    async def _poll_id_from_message(self, payload):
+        """Read the poll ID from the reacted message's embed (polls created before message IDs were stored)"""
         # Get the message
         channel = self.get_channel(payload.channel_id)
         if not channel:
-            return
+            return None
 
         try:
             message = await channel.fetch_message(payload.message_id)
         except:
-            return
+            return None
 
         # Check if this is a poll message (contains poll ID in embed)
         if not message.embeds:
-            return
+            return None
 
         embed = message.embeds[0]
         if embed.title != "📊 Poll":
-            return
+            return None
 
         # Extract poll ID from embed
         poll_id = None
@@ -146,70 +158,48 @@ class BotCore(discord.Client):
                 poll_id = field.value
                 break
 
-        if not poll_id:
-            return
-
-        # Map emoji to option index
-        emoji = str(payload.emoji)
-        option_index = None
-
-        # Handle regional indicator emojis (🇦 to 🇹)
-        if len(emoji) == 1:
-            char_code = ord(emoji)
-            if 0x1F1E6 <= char_code <= 0x1F1F9:  # 🇦 to 🇹 (20 emojis)
-                option_index = char_code - 0x1F1E6
-                print(f"Removed reaction: {emoji} -> option {option_index}")
-
-        if option_index is not None:
-            # Import here to avoid circular imports
-            from handlers.poll_commands import sync_reaction_votes
-            success = await sync_reaction_votes(poll_id, payload.user_id, message)
+        return poll_id
 
     async def check_expired_polls(self):
         """Background task to check and close expired polls"""
         import asyncio
         from datetime import datetime
-        from sqlalchemy.future import select
+        from sqlalchemy import update
         from db.session import AsyncSessionLocal
         from db.models import Poll
 
         while True:
             try:
+                # Close every expired poll in one UPDATE; read paths only compare expires_at
                 async with AsyncSessionLocal() as session:
-                    # Find active polls that have expired
-                    now = datetime.utcnow()
                     result = await session.execute(
-                        select(Poll).where(
-                            Poll.is_active == True,
-                            Poll.expires_at <= now
-                        )
+                        update(Poll)
+                        .where(Poll.is_active == True, Poll.expires_at <= datetime.utcnow())
+                        .values(is_active=False)
+                        .returning(Poll.poll_id, Poll.question, Poll.channel_id)
                     )
-                    expired_polls = result.scalars().all()
-
-                    # Close expired polls and send notifications
-                    for poll in expired_polls:
-                        poll.is_active = False
-                        print(f"Closed expired poll: {poll.poll_id} - {poll.question}")
-
-                        # Send expiration notification to the channel where poll was created
-                        if poll.channel_id:
-                            try:
-                                channel = self.get_channel(poll.channel_id)
-                                if channel and channel.permissions_for(channel.guild.me).send_messages:
-                                    embed = discord.Embed(
-                                        title="📊 Poll Expired",
-                                        description=f"**Poll:** {poll.question}\n**ID:** {poll.poll_id}",
-                                        color=discord.Color.orange()
-                                    )
-                                    embed.add_field(name="Status", value="🔒 Closed", inline=True)
-                                    embed.add_field(name="View Results", value=f"`/poll_results {poll.poll_id}`", inline=True)
-                                    await channel.send(embed=embed)
-                            except Exception as e:
-                                print(f"Could not send expiration notification for poll {poll.poll_id}: {e}")
-
+                    expired_polls = result.all()
                     if expired_polls:
                         await session.commit()
 
+                # Send expiration notifications to the channels where the polls were created
+                for poll in expired_polls:
+                    print(f"Closed expired poll: {poll.poll_id} - {poll.question}")
+                    if poll.channel_id:
+                        try:
+                            channel = self.get_channel(poll.channel_id)
+                            if channel and channel.permissions_for(channel.guild.me).send_messages:
+                                embed = discord.Embed(
+                                    title="📊 Poll Expired",
+                                    description=f"**Poll:** {poll.question}\n**ID:** {poll.poll_id}",
+                                    color=discord.Color.orange()
+                                )
+                                embed.add_field(name="Status", value="🔒 Closed", inline=True)
+                                embed.add_field(name="View Results", value=f"`/poll_results {poll.poll_id}`", inline=True)
+                                await channel.send(embed=embed)
+                        except Exception as e:
+                            print(f"Could not send expiration notification for poll {poll.poll_id}: {e}")
+
             except Exception as e:
                 print(f"Error checking expired polls: {e}")
 
@@ -222,11 +212,11 @@ class BotCore(discord.Client):
             if guild_id:
                 # Sync to specific guild (faster for testing)
                 guild = discord.Object(id=guild_id)
-                synced = await self.tree.sync(guild=guild)
+                synced = await self.rate_limiter.call(f"sync:{guild_id}", lambda: self.tree.sync(guild=guild))
                 print(f"Synced {len(synced)} command(s) to guild {guild_id}")
             else:
                 # Global sync
-                synced = await self.tree.sync()
+                synced = await self.rate_limiter.call("sync:global", self.tree.sync)
                 print(f"Synced {len(synced)} command(s) globally")
             return len(synced)
         except Exception as e:
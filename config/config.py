@@ -0,0 +1,3 @@
+# APScheduler job defaults: jobs delayed by a busy loop or restart get 30s to still run,
+# and a backlog of runs is collapsed into one
+JOB_DEFAULTS = {'coalesce': True, 'misfire_grace_time': 30}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, ForeignKey, JSON, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, ForeignKey, JSON, Text, UniqueConstraint, Index
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 
@@ -27,27 +27,24 @@ class EventReservation(Base):
     calendar_event_ids = Column(JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-class CalendarEvent:
-    def __init__(self, event_id: str, title: str, start_time, end_time):
-        self.event_id = event_id
-        self.title = title
-        self.start_time = start_time
-        self.end_time = end_time
-
 class Poll(Base):
     __tablename__ = 'polls'
     id = Column(Integer, primary_key=True, autoincrement=True)
     poll_id = Column(String, unique=True, nullable=False)
     question = Column(String, nullable=False)
-    options = Column(String, nullable=False)  # Comma-separated options
+    options = Column(JSON, nullable=False)  # List of option strings
     creator_id = Column(BigInteger, nullable=False)
     channel_id = Column(BigInteger)  # Channel where poll was created
+    message_id = Column(BigInteger, nullable=True, index=True)  # Poll message, for reaction polls
     is_active = Column(Boolean, default=True)
     is_advanced = Column(Boolean, default=False)
     external_id = Column(String)  # For advanced polls (e.g., StrawPoll ID)
     created_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime)
 
+    # Expired-poll sweeps and list_polls filter on these
+    __table_args__ = (Index('ix_poll_active_expires', 'is_active', 'expires_at'),)
+
 class Vote(Base):
     __tablename__ = 'votes'
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -56,6 +53,9 @@ class Vote(Base):
     option_index = Column(Integer, nullable=False)
     voted_at = Column(DateTime, default=datetime.utcnow)
 
+    # Vote replacement and reaction syncs look up one user's votes in one poll
+    __table_args__ = (Index('ix_vote_poll_user', 'poll_id', 'user_id'),)
+
 class SharedCalendar(Base):
     __tablename__ = "shared_calendars"
 
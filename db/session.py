@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import os
 from dotenv import load_dotenv
 
@@ -14,5 +15,18 @@ if not DATABASE_URL:
 if DATABASE_URL.startswith('postgresql://'):
     DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+# Logging every statement is costly on hot paths, so SQL echo is opt-in via DB_ECHO
+DB_ECHO = os.getenv('DB_ECHO', '').lower() in ('1', 'true', 'yes')
+
+# One pool shared by every AsyncSessionLocal(); sessions are short-lived, so a modest
+# pool with overflow covers bursts, and pre-ping drops connections the server closed
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=DB_ECHO,
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+    max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '20')),
+    pool_pre_ping=True
+)
 AsyncSessionLocal = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
\ No newline at end of file
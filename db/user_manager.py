@@ -1,5 +1,7 @@
 import asyncio
+from sqlalchemy import update
 from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from .models import UserProfile
 from .session import AsyncSessionLocal
 from typing import Optional, Any, Dict
@@ -15,10 +17,9 @@ class UserManager:
             return result.scalar_one_or_none()
 
     async def ensure_user(self, discord_id: int, calendar_email: str = "", roles: list = None) -> UserProfile:
-        """Ensure user exists, create if necessary"""
+        """Get the user, creating it first if necessary (get-or-create in one session)"""
         async with AsyncSessionLocal() as session:
-            result = await session.execute(select(UserProfile).where(UserProfile.discord_id == discord_id))
-            user = result.scalar_one_or_none()
+            user = await session.get(UserProfile, discord_id)
 
             if not user:
                 user = UserProfile(
@@ -35,19 +36,35 @@ class UserManager:
 
     async def update_user_info(self, discord_id: int, **kwargs) -> bool:
         """Update user information (calendar_email, roles, etc.)"""
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(select(UserProfile).where(UserProfile.discord_id == discord_id))
-            user = result.scalar_one_or_none()
+        # Update allowed fields
+        allowed_fields = ['calendar_email', 'roles']
+        values = {field: value for field, value in kwargs.items() if field in allowed_fields}
 
-            if not user:
-                return False
+        if not values:
+            return await self.get_user(discord_id) is not None
 
-            # Update allowed fields
-            allowed_fields = ['calendar_email', 'roles']
-            for field, value in kwargs.items():
-                if field in allowed_fields and hasattr(user, field):
-                    setattr(user, field, value)
+        async with AsyncSessionLocal() as session:
+            # A single UPDATE; rowcount tells us whether the user exists
+            result = await session.execute(
+                update(UserProfile)
+                .where(UserProfile.discord_id == discord_id)
+                .values(**values)
+            )
+            await session.commit()
+            return result.rowcount > 0
+
+    async def set_calendar_email(self, discord_id: int, calendar_email: str) -> bool:
+        """Set the user's calendar email in one statement, creating the user if necessary"""
+        stmt = pg_insert(UserProfile).values(
+            discord_id=discord_id, calendar_email=calendar_email, roles=[], preferences={}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserProfile.discord_id],
+            set_={"calendar_email": stmt.excluded.calendar_email}
+        )
 
+        async with AsyncSessionLocal() as session:
+            await session.execute(stmt)
             await session.commit()
             return True
 
@@ -148,12 +165,10 @@ class UserManager:
     async def clear_preferences(self, discord_id: int) -> bool:
         """Clear all preferences for user"""
         async with AsyncSessionLocal() as session:
-            result = await session.execute(select(UserProfile).where(UserProfile.discord_id == discord_id))
-            user = result.scalar_one_or_none()
-
-            if not user:
-                return False
-
-            user.preferences = {}
+            result = await session.execute(
+                update(UserProfile)
+                .where(UserProfile.discord_id == discord_id)
+                .values(preferences={})
+            )
             await session.commit()
-            return True
+            return result.rowcount > 0
@@ -1,328 +1,365 @@
+import bisect
 import discord
+import importlib
+import inspect
 from discord import app_commands
-from handlers.reminder_commands import (
-    create_reminder_template_command, list_reminder_templates_command,
-    set_poll_reminder_command, set_custom_reminder_command,
-    list_my_reminders_command, cancel_reminder_command, reminder_logs_command,
-    quick_poll_reminders_command
-)
-from handlers.stat_commands import stats_command
-from handlers.calendar_management import (
-    calendar_help_command, link_user_calendar_command, create_shared_calendar_command,
-    add_calendar_users_command, list_calendar_users_command, remove_calendar_users_command,
-    add_event_command, list_events_command, update_event_command, delete_event_command,
-    visualize_day_command
-)
-from handlers.calendar_commands import find_free_slots_command, reserve_slot_command
-from handlers.poll_commands import create_poll_command, create_advanced_poll_command, vote_poll_command, poll_results_command, list_polls_command, delete_poll_command
-from handlers.user_commands import (
-    update_roles_command, user_status_command, set_preference_command, get_preference_command, remove_preference_command,
-    list_preferences_command, clear_preferences_command, update_calendar_email_command,
-    manage_user_role_command, user_admin_info_command
-)
 
-from handlers.help_commands import help_command
-from handlers.role_management import (
-    create_role_command, delete_role_command, list_role_permissions_command,
-    add_role_permission_command, remove_role_permission_command, list_role_members_command,
-    add_user_to_role_command, remove_user_from_role_command, list_user_roles_command,
-    list_all_roles_command
-)
+# Handler callables are resolved the first time their command runs rather than at
+# import time, so starting the bot doesn't pull in every handler's dependency graph.
+_HANDLERS = {
+    "create_reminder_template_command": "handlers.reminder_commands",
+    "list_reminder_templates_command": "handlers.reminder_commands",
+    "set_poll_reminder_command": "handlers.reminder_commands",
+    "set_custom_reminder_command": "handlers.reminder_commands",
+    "list_my_reminders_command": "handlers.reminder_commands",
+    "cancel_reminder_command": "handlers.reminder_commands",
+    "reminder_logs_command": "handlers.reminder_commands",
+    "quick_poll_reminders_command": "handlers.reminder_commands",
+    "stats_command": "handlers.stat_commands",
+    "calendar_help_command": "handlers.calendar_management",
+    "link_user_calendar_command": "handlers.calendar_management",
+    "create_shared_calendar_command": "handlers.calendar_management",
+    "add_calendar_users_command": "handlers.calendar_management",
+    "list_calendar_users_command": "handlers.calendar_management",
+    "remove_calendar_users_command": "handlers.calendar_management",
+    "add_event_command": "handlers.calendar_management",
+    "list_events_command": "handlers.calendar_management",
+    "update_event_command": "handlers.calendar_management",
+    "delete_event_command": "handlers.calendar_management",
+    "visualize_day_command": "handlers.calendar_management",
+    "find_free_slots_command": "handlers.calendar_commands",
+    "reserve_slot_command": "handlers.calendar_commands",
+    "create_poll_command": "handlers.poll_commands",
+    "create_advanced_poll_command": "handlers.poll_commands",
+    "vote_poll_command": "handlers.poll_commands",
+    "poll_results_command": "handlers.poll_commands",
+    "list_polls_command": "handlers.poll_commands",
+    "delete_poll_command": "handlers.poll_commands",
+    "update_roles_command": "handlers.user_commands",
+    "user_status_command": "handlers.user_commands",
+    "set_preference_command": "handlers.user_commands",
+    "get_preference_command": "handlers.user_commands",
+    "remove_preference_command": "handlers.user_commands",
+    "list_preferences_command": "handlers.user_commands",
+    "clear_preferences_command": "handlers.user_commands",
+    "update_calendar_email_command": "handlers.user_commands",
+    "manage_user_role_command": "handlers.user_commands",
+    "user_admin_info_command": "handlers.user_commands",
+    "help_command": "handlers.help_commands",
+    "create_role_command": "handlers.role_management",
+    "delete_role_command": "handlers.role_management",
+    "list_role_permissions_command": "handlers.role_management",
+    "add_role_permission_command": "handlers.role_management",
+    "remove_role_permission_command": "handlers.role_management",
+    "list_role_members_command": "handlers.role_management",
+    "add_user_to_role_command": "handlers.role_management",
+    "remove_user_from_role_command": "handlers.role_management",
+    "list_user_roles_command": "handlers.role_management",
+    "list_all_roles_command": "handlers.role_management",
+}
+
+# handler name -> callable, filled in the first time each command is dispatched
+_resolved_handlers = {}
+
+def _resolve(name: str):
+    """Import a handler's module on first use and memoize the callable"""
+    handler = _resolved_handlers.get(name)
+    if handler is None:
+        handler = getattr(importlib.import_module(_HANDLERS[name]), name)
+        _resolved_handlers[name] = handler
+    return handler
 
 # --- Autocomplete helpers ---
+# Discord shows at most 25 autocomplete choices
+MAX_AUTOCOMPLETE_CHOICES = 25
+
 async def command_autocomplete(interaction: discord.Interaction, current: str):
-    commands = [
-        "help", "stats", "update_roles", "user_status", "set_preference", "get_preference", "remove_preference", "list_preferences", "clear_preferences", "update_calendar_email", "manage_user_role", "user_admin_info",
-        "create_reminder_template", "list_reminder_templates", "set_poll_reminder", "set_custom_reminder", "quick_poll_reminders", "list_my_reminders", "cancel_reminder", "reminder_logs",
-        "create_poll", "create_advanced_poll", "vote_poll", "poll_results", "list_polls", "delete_poll",
-        "create_role", "delete_role", "list_role_permissions", "add_role_permission", "remove_role_permission", "list_role_members", "add_user_to_role", "remove_user_from_role", "list_user_roles", "list_all_roles",
-        "calendar_help", "link_user_calendar", "create_shared_calendar", "add_calendar_users", "list_calendar_users", "remove_calendar_users", "add_event", "list_events", "update_event", "delete_event", "visualize_day", "find_free_slots", "reserve_slot",
-        "sync_commands"
+    if not current:
+        return _DEFAULT_COMMAND_CHOICES
+    current_lc = current.lower()
+
+    # Prefix matches are a contiguous run in the sorted list, so they come first
+    prefix_hits = []
+    i = bisect.bisect_left(_SORTED_COMMANDS, current_lc)
+    while i < len(_SORTED_COMMANDS) and _SORTED_COMMANDS[i].startswith(current_lc) and len(prefix_hits) < MAX_AUTOCOMPLETE_CHOICES:
+        prefix_hits.append(_SORTED_COMMANDS[i])
+        i += 1
+    choices = [_COMMAND_CHOICES[cmd] for cmd in prefix_hits]
+
+    # Then fill up with the remaining substring matches
+    if len(choices) < MAX_AUTOCOMPLETE_CHOICES:
+        seen = set(prefix_hits)
+        for cmd_lc, cmd in _COMMANDS_LC:
+            if current_lc in cmd_lc and cmd not in seen:
+                choices.append(_COMMAND_CHOICES[cmd])
+                if len(choices) == MAX_AUTOCOMPLETE_CHOICES:
+                    break
+    return choices
+
+# guild_id -> [(lowercased role name, Choice)], dropped by BotCore on role create/update/delete.
+# The Choices live only in these entries, so they are built once per rebuild and freed with them.
+_ROLE_CACHE = {}
+
+def _rebuild_role_cache(guild: discord.Guild):
+    # Guild.roles sorts by position on every access, but this only runs on a cache rebuild
+    entries = [
+        (role.name.lower(), app_commands.Choice(name=role.name, value=role.name))
+        for role in guild.roles
     ]
-    return [app_commands.Choice(name=cmd, value=cmd) for cmd in commands if current.lower() in cmd.lower()]
+    _ROLE_CACHE[guild.id] = entries
+    return entries
+
+def invalidate_role_cache(guild_id: int):
+    """Forget the cached role choices for a guild"""
+    _ROLE_CACHE.pop(guild_id, None)
 
 async def role_autocomplete(interaction: discord.Interaction, current: str):
-    roles = [role.name for role in interaction.guild.roles]
-    return [app_commands.Choice(name=role, value=role) for role in roles if current.lower() in role.lower()]
+    guild = interaction.guild
+    entries = _ROLE_CACHE.get(guild.id)
+    if entries is None:
+        entries = _rebuild_role_cache(guild)
+    if not current:
+        return [choice for name_lc, choice in entries[:MAX_AUTOCOMPLETE_CHOICES]]
+    current_lc = current.lower()
+    return [choice for name_lc, choice in entries if current_lc in name_lc][:MAX_AUTOCOMPLETE_CHOICES]
 
 
 # --- Slash Commands Registration ---
-def register_all_commands(bot):
-    tree = bot.tree
+# Static response, built once and never mutated
+EMBED_SYNC_DENIED = discord.Embed(
+    title="❌ Permission Denied",
+    description="Only the bot owner can sync commands.",
+    color=discord.Color.red()
+)
+
+def _param(name: str, annotation, default=inspect.Parameter.empty) -> inspect.Parameter:
+    return inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation, default=default)
 
-    @tree.command(name="help", description="Show all bot commands")
-    async def help_slash(interaction: discord.Interaction):
-        await help_command(interaction)
+def _choices(*values: str) -> list:
+    return [app_commands.Choice(name=value, value=value) for value in values]
 
-    @tree.command(name="stats", description="Show voting and poll stats")
-    async def stats_slash(interaction: discord.Interaction):
-        await stats_command(interaction)
+# Each entry is (name, description, handler name, parameters, decorator kwargs). The
+# handler receives the parameters positionally in the order listed here; the optional
+# "describe", "choices" and "autocomplete" kwargs feed the matching app_commands decorators.
+COMMAND_TABLE = (
+    ("help", "Show all bot commands", "help_command", (), {}),
+    ("stats", "Show voting and poll stats", "stats_command", (), {}),
 
     # User management commands
-    @tree.command(name="update_roles", description="Update roles for a user")
-    @app_commands.describe(user="User to update", roles="Comma-separated roles")
-    async def update_roles_slash(interaction: discord.Interaction, user: discord.Member, roles: str):
-        await update_roles_command(interaction, user, roles)
+    ("update_roles", "Update roles for a user", "update_roles_command",
+     (_param("user", discord.Member), _param("roles", str)),
+     {"describe": dict(user="User to update", roles="Comma-separated roles")}),
 
     # Enhanced User Management Commands
-    @tree.command(name="user_status", description="Check your current user status and preferences")
-    @app_commands.describe(user="User to check (admin only)")
-    async def user_status_slash(interaction: discord.Interaction, user: discord.Member = None):
-        await user_status_command(interaction, user)
-
-    @tree.command(name="set_preference", description="Set a preference value")
-    @app_commands.describe(key="Preference key", value="Preference value")
-    async def set_preference_slash(interaction: discord.Interaction, key: str, value: str):
-        await set_preference_command(interaction, key, value)
-
-    @tree.command(name="get_preference", description="Get a preference value")
-    @app_commands.describe(key="Preference key")
-    async def get_preference_slash(interaction: discord.Interaction, key: str):
-        await get_preference_command(interaction, key)
-
-    @tree.command(name="remove_preference", description="Remove a preference")
-    @app_commands.describe(key="Preference key")
-    async def remove_preference_slash(interaction: discord.Interaction, key: str):
-        await remove_preference_command(interaction, key)
-
-    @tree.command(name="list_preferences", description="List all your preferences")
-    async def list_preferences_slash(interaction: discord.Interaction):
-        await list_preferences_command(interaction)
-
-    @tree.command(name="clear_preferences", description="Clear all your preferences")
-    async def clear_preferences_slash(interaction: discord.Interaction):
-        await clear_preferences_command(interaction)
-
-    @tree.command(name="update_calendar_email", description="Update your calendar email")
-    @app_commands.describe(email="Your email address")
-    async def update_calendar_email_slash(interaction: discord.Interaction, email: str):
-        await update_calendar_email_command(interaction, email)
-
-    @tree.command(name="manage_user_role", description="Add or remove a role from a user (Admin only)")
-    @app_commands.describe(user="User to manage", role="Role name", action="Add or remove")
-    @app_commands.choices(action=[
-        app_commands.Choice(name="add", value="add"),
-        app_commands.Choice(name="remove", value="remove")
-    ])
-    async def manage_user_role_slash(interaction: discord.Interaction, user: discord.Member, role: str, action: app_commands.Choice[str] = "add"):
-        await manage_user_role_command(interaction, user, role, action.value if hasattr(action, 'value') else action)
-
-    @tree.command(name="user_admin_info", description="Get detailed user information (Admin only)")
-    @app_commands.describe(user="User to check")
-    async def user_admin_info_slash(interaction: discord.Interaction, user: discord.Member):
-        await user_admin_info_command(interaction, user)
+    ("user_status", "Check your current user status and preferences", "user_status_command",
+     (_param("user", discord.Member, None),),
+     {"describe": dict(user="User to check (admin only)")}),
+    ("set_preference", "Set a preference value", "set_preference_command",
+     (_param("key", str), _param("value", str)),
+     {"describe": dict(key="Preference key", value="Preference value")}),
+    ("get_preference", "Get a preference value", "get_preference_command",
+     (_param("key", str),),
+     {"describe": dict(key="Preference key")}),
+    ("remove_preference", "Remove a preference", "remove_preference_command",
+     (_param("key", str),),
+     {"describe": dict(key="Preference key")}),
+    ("list_preferences", "List all your preferences", "list_preferences_command", (), {}),
+    ("clear_preferences", "Clear all your preferences", "clear_preferences_command", (), {}),
+    ("update_calendar_email", "Update your calendar email", "update_calendar_email_command",
+     (_param("email", str),),
+     {"describe": dict(email="Your email address")}),
+    ("manage_user_role", "Add or remove a role from a user (Admin only)", "manage_user_role_command",
+     (_param("user", discord.Member), _param("role", str), _param("action", app_commands.Choice[str], "add")),
+     {"describe": dict(user="User to manage", role="Role name", action="Add or remove"),
+      "choices": dict(action=_choices("add", "remove"))}),
+    ("user_admin_info", "Get detailed user information (Admin only)", "user_admin_info_command",
+     (_param("user", discord.Member),),
+     {"describe": dict(user="User to check")}),
 
     # Reminder Template Commands
-    @tree.command(name="create_reminder_template", description="Create a new reminder template")
-    @app_commands.describe(name="Template name", message_template="Message template with {variables}", priority="Priority level", description="Template description", ping_roles="Role IDs to ping (comma-separated)", ping_users="User IDs to ping (comma-separated)")
-    @app_commands.choices(priority=[
-        app_commands.Choice(name="informational", value="informational"),
-        app_commands.Choice(name="urgent", value="urgent"),
-        app_commands.Choice(name="very_urgent", value="very_urgent"),
-        app_commands.Choice(name="critical", value="critical")
-    ])
-    async def create_reminder_template_slash(interaction: discord.Interaction, name: str, message_template: str, priority: app_commands.Choice[str] = "informational", description: str = "", ping_roles: str = "", ping_users: str = ""):
-        await create_reminder_template_command(interaction, name, message_template, priority.value if hasattr(priority, 'value') else priority, description or None, ping_roles or None, ping_users or None)
-
-    @tree.command(name="list_reminder_templates", description="List all available reminder templates")
-    @app_commands.describe(show_mine_only="Show only your templates")
-    async def list_reminder_templates_slash(interaction: discord.Interaction, show_mine_only: bool = False):
-        await list_reminder_templates_command(interaction, show_mine_only)
+    ("create_reminder_template", "Create a new reminder template", "create_reminder_template_command",
+     (_param("name", str), _param("message_template", str), _param("priority", app_commands.Choice[str], "informational"),
+      _param("description", str, None), _param("ping_roles", str, None), _param("ping_users", str, None)),
+     {"describe": dict(name="Template name", message_template="Message template with {variables}", priority="Priority level", description="Template description", ping_roles="Role IDs to ping (comma-separated)", ping_users="User IDs to ping (comma-separated)"),
+      "choices": dict(priority=_choices("informational", "urgent", "very_urgent", "critical"))}),
+    ("list_reminder_templates", "List all available reminder templates", "list_reminder_templates_command",
+     (_param("show_mine_only", bool, False),),
+     {"describe": dict(show_mine_only="Show only your templates")}),
 
     # Poll Reminder Commands
-    @tree.command(name="set_poll_reminder", description="Set a reminder for a poll")
-    @app_commands.describe(poll_id="Poll ID", template_name="Template name", reminder_type="Type of reminder", minutes_before="Minutes before expiry", interval_minutes="Minutes between reminders", max_occurrences="Max recurring reminders", specific_time="Specific time (YYYY-MM-DD HH:MM)")
-    @app_commands.choices(reminder_type=[
-        app_commands.Choice(name="time_before", value="time_before"),
-        app_commands.Choice(name="interval", value="interval"),
-        app_commands.Choice(name="specific_time", value="specific_time")
-    ])
-    async def set_poll_reminder_slash(interaction: discord.Interaction, poll_id: str, template_name: str, reminder_type: app_commands.Choice[str] = "time_before", minutes_before: int = None, interval_minutes: int = None, max_occurrences: int = None, specific_time: str = None):
-        await set_poll_reminder_command(interaction, poll_id, template_name, reminder_type.value if hasattr(reminder_type, 'value') else reminder_type, minutes_before, interval_minutes, max_occurrences, specific_time)
-
-    @tree.command(name="set_custom_reminder", description="Set a custom reminder")
-    @app_commands.describe(template_name="Template name", reminder_type="Type of reminder", interval_minutes="Minutes between reminders", max_occurrences="Max recurring reminders", specific_time="Specific time (YYYY-MM-DD HH:MM)", custom_data="Custom data (key=value,key2=value2)")
-    @app_commands.choices(reminder_type=[
-        app_commands.Choice(name="interval", value="interval"),
-        app_commands.Choice(name="specific_time", value="specific_time")
-    ])
-    async def set_custom_reminder_slash(interaction: discord.Interaction, template_name: str, reminder_type: app_commands.Choice[str] = "specific_time", interval_minutes: int = None, max_occurrences: int = None, specific_time: str = None, custom_data: str = None):
-        await set_custom_reminder_command(interaction, template_name, reminder_type.value if hasattr(reminder_type, 'value') else reminder_type, interval_minutes, max_occurrences, specific_time, custom_data)
-
-    @tree.command(name="quick_poll_reminders", description="Set up common poll reminders quickly")
-    @app_commands.describe(poll_id="Poll ID", template_name="Template name", remind_times="Minutes before expiry (comma-separated)")
-    async def quick_poll_reminders_slash(interaction: discord.Interaction, poll_id: str, template_name: str = "poll_reminder", remind_times: str = "60,30,10"):
-        await quick_poll_reminders_command(interaction, poll_id, template_name, remind_times)
+    ("set_poll_reminder", "Set a reminder for a poll", "set_poll_reminder_command",
+     (_param("poll_id", str), _param("template_name", str), _param("reminder_type", app_commands.Choice[str], "time_before"),
+      _param("minutes_before", int, None), _param("interval_minutes", int, None), _param("max_occurrences", int, None), _param("specific_time", str, None)),
+     {"describe": dict(poll_id="Poll ID", template_name="Template name", reminder_type="Type of reminder", minutes_before="Minutes before expiry", interval_minutes="Minutes between reminders", max_occurrences="Max recurring reminders", specific_time="Specific time (YYYY-MM-DD HH:MM)"),
+      "choices": dict(reminder_type=_choices("time_before", "interval", "specific_time"))}),
+    ("set_custom_reminder", "Set a custom reminder", "set_custom_reminder_command",
+     (_param("template_name", str), _param("reminder_type", app_commands.Choice[str], "specific_time"),
+      _param("interval_minutes", int, None), _param("max_occurrences", int, None), _param("specific_time", str, None), _param("custom_data", str, None)),
+     {"describe": dict(template_name="Template name", reminder_type="Type of reminder", interval_minutes="Minutes between reminders", max_occurrences="Max recurring reminders", specific_time="Specific time (YYYY-MM-DD HH:MM)", custom_data="Custom data (key=value,key2=value2)"),
+      "choices": dict(reminder_type=_choices("interval", "specific_time"))}),
+    ("quick_poll_reminders", "Set up common poll reminders quickly", "quick_poll_reminders_command",
+     (_param("poll_id", str), _param("template_name", str, "poll_reminder"), _param("remind_times", str, "60,30,10")),
+     {"describe": dict(poll_id="Poll ID", template_name="Template name", remind_times="Minutes before expiry (comma-separated)")}),
 
     # Reminder Management Commands
-    @tree.command(name="list_my_reminders", description="List your active reminders")
-    @app_commands.describe(show_inactive="Include inactive reminders")
-    async def list_my_reminders_slash(interaction: discord.Interaction, show_inactive: bool = False):
-        await list_my_reminders_command(interaction, show_inactive)
-
-    @tree.command(name="cancel_reminder", description="Cancel a specific reminder")
-    @app_commands.describe(reminder_id="Reminder ID")
-    async def cancel_reminder_slash(interaction: discord.Interaction, reminder_id: str):
-        await cancel_reminder_command(interaction, reminder_id)
-
-    @tree.command(name="reminder_logs", description="View execution logs for a reminder")
-    @app_commands.describe(reminder_id="Reminder ID")
-    async def reminder_logs_slash(interaction: discord.Interaction, reminder_id: str):
-        await reminder_logs_command(interaction, reminder_id)
+    ("list_my_reminders", "List your active reminders", "list_my_reminders_command",
+     (_param("show_inactive", bool, False),),
+     {"describe": dict(show_inactive="Include inactive reminders")}),
+    ("cancel_reminder", "Cancel a specific reminder", "cancel_reminder_command",
+     (_param("reminder_id", str),),
+     {"describe": dict(reminder_id="Reminder ID")}),
+    ("reminder_logs", "View execution logs for a reminder", "reminder_logs_command",
+     (_param("reminder_id", str),),
+     {"describe": dict(reminder_id="Reminder ID")}),
 
     # Calendar Management Commands
-    @tree.command(name="calendar_help", description="Show calendar setup instructions")
-    async def calendar_help_slash(interaction: discord.Interaction):
-        await calendar_help_command(interaction)
-
-    @tree.command(name="link_user_calendar", description="Link your personal Google Calendar")
-    @app_commands.describe(calendar_id="Your Google Calendar ID (email format)")
-    async def link_user_calendar_slash(interaction: discord.Interaction, calendar_id: str = ""):
-        await link_user_calendar_command(interaction, calendar_id)
-
-    @tree.command(name="create_shared_calendar", description="Create a shared calendar (Admin only)")
-    @app_commands.describe(calendar_name="Name of the calendar", description="Optional description")
-    async def create_shared_calendar_slash(interaction: discord.Interaction, calendar_name: str, description: str = ""):
-        await create_shared_calendar_command(interaction, calendar_name, description)
-
-    @tree.command(name="add_calendar_users", description="Add users to shared calendar (Admin only)")
-    @app_commands.describe(calendar_name="Calendar name", permission="Permission level (reader/writer/owner)", roles="Comma-separated roles", users="Comma-separated users")
-    async def add_calendar_users_slash(interaction: discord.Interaction, calendar_name: str, permission: str, roles: str = "", users: str = ""):
-        await add_calendar_users_command(interaction, calendar_name, permission, roles, users)
-
-    @tree.command(name="list_calendar_users", description="List users with access to a calendar")
-    @app_commands.describe(calendar_name="Calendar name")
-    async def list_calendar_users_slash(interaction: discord.Interaction, calendar_name: str):
-        await list_calendar_users_command(interaction, calendar_name)
-
-    @tree.command(name="remove_calendar_users", description="Remove users from shared calendar (Admin only)")
-    @app_commands.describe(calendar_name="Calendar name", roles="Comma-separated roles", users="Comma-separated users")
-    async def remove_calendar_users_slash(interaction: discord.Interaction, calendar_name: str, roles: str = "", users: str = ""):
-        await remove_calendar_users_command(interaction, calendar_name, roles, users)
+    ("calendar_help", "Show calendar setup instructions", "calendar_help_command", (), {}),
+    ("link_user_calendar", "Link your personal Google Calendar", "link_user_calendar_command",
+     (_param("calendar_id", str, ""),),
+     {"describe": dict(calendar_id="Your Google Calendar ID (email format)")}),
+    ("create_shared_calendar", "Create a shared calendar (Admin only)", "create_shared_calendar_command",
+     (_param("calendar_name", str), _param("description", str, "")),
+     {"describe": dict(calendar_name="Name of the calendar", description="Optional description")}),
+    ("add_calendar_users", "Add users to shared calendar (Admin only)", "add_calendar_users_command",
+     (_param("calendar_name", str), _param("permission", str), _param("roles", str, ""), _param("users", str, "")),
+     {"describe": dict(calendar_name="Calendar name", permission="Permission level (reader/writer/owner)", roles="Comma-separated roles", users="Comma-separated users")}),
+    ("list_calendar_users", "List users with access to a calendar", "list_calendar_users_command",
+     (_param("calendar_name", str),),
+     {"describe": dict(calendar_name="Calendar name")}),
+    ("remove_calendar_users", "Remove users from shared calendar (Admin only)", "remove_calendar_users_command",
+     (_param("calendar_name", str), _param("roles", str, ""), _param("users", str, "")),
+     {"describe": dict(calendar_name="Calendar name", roles="Comma-separated roles", users="Comma-separated users")}),
 
     # Event Management Commands
-    @tree.command(name="add_event", description="Add event to shared calendar")
-    @app_commands.describe(calendar_name="Calendar name", event_name="Event name", start_time="Start (YYYY-MM-DD HH:MM)", end_time="End (YYYY-MM-DD HH:MM)", location="Location (optional)", description="Description (optional)", roles="Roles to assign (optional)")
-    async def add_event_slash(interaction: discord.Interaction, calendar_name: str, event_name: str, start_time: str, end_time: str, location: str = "", description: str = "", roles: str = ""):
-        await add_event_command(interaction, calendar_name, event_name, start_time, end_time, location, description, roles)
-
-    @tree.command(name="list_events", description="List events in a calendar")
-    @app_commands.describe(calendar_name="Calendar name", days_ahead="Days to look ahead")
-    async def list_events_slash(interaction: discord.Interaction, calendar_name: str, days_ahead: int = 7):
-        await list_events_command(interaction, calendar_name, days_ahead)
-
-    @tree.command(name="update_event", description="Update an existing event")
-    @app_commands.describe(calendar_name="Calendar name", event_id="Event ID", event_name="New name (optional)", start_time="New start (optional)", end_time="New end (optional)", location="New location (optional)", description="New description (optional)")
-    async def update_event_slash(interaction: discord.Interaction, calendar_name: str, event_id: str, event_name: str = "", start_time: str = "", end_time: str = "", location: str = "", description: str = ""):
-        await update_event_command(interaction, calendar_name, event_id, event_name, start_time, end_time, location, description)
-
-    @tree.command(name="delete_event", description="Delete an event from calendar")
-    @app_commands.describe(calendar_name="Calendar name", event_id="Event ID")
-    async def delete_event_slash(interaction: discord.Interaction, calendar_name: str, event_id: str):
-        await delete_event_command(interaction, calendar_name, event_id)
-
-    @tree.command(name="visualize_day", description="Visualize a day with events")
-    @app_commands.describe(calendar_name="Calendar name", date="Date (YYYY-MM-DD)", start_hour="Start hour (0-23)", end_hour="End hour (0-23)")
-    async def visualize_day_slash(interaction: discord.Interaction, calendar_name: str, date: str, start_hour: int = 8, end_hour: int = 18):
-        await visualize_day_command(interaction, calendar_name, date, start_hour, end_hour)
+    ("add_event", "Add event to shared calendar", "add_event_command",
+     (_param("calendar_name", str), _param("event_name", str), _param("start_time", str), _param("end_time", str),
+      _param("location", str, ""), _param("description", str, ""), _param("roles", str, "")),
+     {"describe": dict(calendar_name="Calendar name", event_name="Event name", start_time="Start (YYYY-MM-DD HH:MM)", end_time="End (YYYY-MM-DD HH:MM)", location="Location (optional)", description="Description (optional)", roles="Roles to assign (optional)")}),
+    ("list_events", "List events in a calendar", "list_events_command",
+     (_param("calendar_name", str), _param("days_ahead", int, 7)),
+     {"describe": dict(calendar_name="Calendar name", days_ahead="Days to look ahead")}),
+    ("update_event", "Update an existing event", "update_event_command",
+     (_param("calendar_name", str), _param("event_id", str), _param("event_name", str, ""), _param("start_time", str, ""),
+      _param("end_time", str, ""), _param("location", str, ""), _param("description", str, "")),
+     {"describe": dict(calendar_name="Calendar name", event_id="Event ID", event_name="New name (optional)", start_time="New start (optional)", end_time="New end (optional)", location="New location (optional)", description="New description (optional)")}),
+    ("delete_event", "Delete an event from calendar", "delete_event_command",
+     (_param("calendar_name", str), _param("event_id", str)),
+     {"describe": dict(calendar_name="Calendar name", event_id="Event ID")}),
+    ("visualize_day", "Visualize a day with events", "visualize_day_command",
+     (_param("calendar_name", str), _param("date", str), _param("start_hour", int, 8), _param("end_hour", int, 18)),
+     {"describe": dict(calendar_name="Calendar name", date="Date (YYYY-MM-DD)", start_hour="Start hour (0-23)", end_hour="End hour (0-23)")}),
 
     # Poll commands
-    @tree.command(name="create_poll", description="Create a simple poll (reactions)")
-    @app_commands.describe(question="Poll question", options="Comma-separated options", duration="Duration in minutes")
-    async def create_poll_slash(interaction: discord.Interaction, question: str, options: str, duration: int = 60):
-        await create_poll_command(interaction, question, options, duration)
-
-    @tree.command(name="create_advanced_poll", description="Create an advanced poll (StrawPoll)")
-    @app_commands.describe(question="Poll question", options="Comma-separated options", multi="Allow multiple answers?")
-    async def create_advanced_poll_slash(interaction: discord.Interaction, question: str, options: str, multi: bool = False):
-        await create_advanced_poll_command(interaction, question, options, multi)
-
-    @tree.command(name="vote_poll", description="Vote in a poll")
-    @app_commands.describe(poll_id="Poll ID", option_indexes="Option number(s) - single: '2' or multiple: '1,3,5'")
-    async def vote_poll_slash(interaction: discord.Interaction, poll_id: str, option_indexes: str):
-        await vote_poll_command(interaction, poll_id, option_indexes)
-
-    @tree.command(name="poll_results", description="Show poll results with visualization")
-    @app_commands.describe(poll_id="Poll ID")
-    async def poll_results_slash(interaction: discord.Interaction, poll_id: str):
-        await poll_results_command(interaction, poll_id)
-
-    @tree.command(name="list_polls", description="List all active polls")
-    async def list_polls_slash(interaction: discord.Interaction):
-        await list_polls_command(interaction)
-
-    @tree.command(name="delete_poll", description="Delete a poll")
-    @app_commands.describe(poll_id="Poll ID")
-    async def delete_poll_slash(interaction: discord.Interaction, poll_id: str):
-        await delete_poll_command(interaction, poll_id)
+    ("create_poll", "Create a simple poll (reactions)", "create_poll_command",
+     (_param("question", str), _param("options", str), _param("duration", int, 60)),
+     {"describe": dict(question="Poll question", options="Comma-separated options", duration="Duration in minutes")}),
+    ("create_advanced_poll", "Create an advanced poll (StrawPoll)", "create_advanced_poll_command",
+     (_param("question", str), _param("options", str), _param("multi", bool, False)),
+     {"describe": dict(question="Poll question", options="Comma-separated options", multi="Allow multiple answers?")}),
+    ("vote_poll", "Vote in a poll", "vote_poll_command",
+     (_param("poll_id", str), _param("option_indexes", str)),
+     {"describe": dict(poll_id="Poll ID", option_indexes="Option number(s) - single: '2' or multiple: '1,3,5'")}),
+    ("poll_results", "Show poll results with visualization", "poll_results_command",
+     (_param("poll_id", str),),
+     {"describe": dict(poll_id="Poll ID")}),
+    ("list_polls", "List all active polls", "list_polls_command", (), {}),
+    ("delete_poll", "Delete a poll", "delete_poll_command",
+     (_param("poll_id", str),),
+     {"describe": dict(poll_id="Poll ID")}),
 
     # Role Management Commands
-    @tree.command(name="create_role", description="Create a new role with optional commands (Owner only)")
-    @app_commands.describe(role_name="Name of the role to create", commands="Comma-separated commands (optional)")
-    async def create_role_slash(interaction: discord.Interaction, role_name: str, commands: str = ""):
-        await create_role_command(interaction, role_name, commands)
-
-    @tree.command(name="delete_role", description="Delete a role and update all related data (Owner only)")
-    @app_commands.describe(role_name="Name of the role to delete")
-    @app_commands.autocomplete(role_name=role_autocomplete)
-    async def delete_role_slash(interaction: discord.Interaction, role_name: str):
-        await delete_role_command(interaction, role_name)
-
-    @tree.command(name="list_role_permissions", description="List permissions/commands for a specific role")
-    @app_commands.describe(role_name="Name of the role")
-    @app_commands.autocomplete(role_name=role_autocomplete)
-    async def list_role_permissions_slash(interaction: discord.Interaction, role_name: str):
-        await list_role_permissions_command(interaction, role_name)
-
-    @tree.command(name="add_role_permission", description="Add a command permission to a role (Owner only)")
-    @app_commands.describe(role_name="Name of the role", command="Command to allow")
-    @app_commands.autocomplete(role_name=role_autocomplete, command=command_autocomplete)
-    async def add_role_permission_slash(interaction: discord.Interaction, role_name: str, command: str):
-        await add_role_permission_command(interaction, role_name, command)
-
-    @tree.command(name="remove_role_permission", description="Remove a command permission from a role (Owner only)")
-    @app_commands.describe(role_name="Name of the role", command="Command to remove")
-    @app_commands.autocomplete(role_name=role_autocomplete, command=command_autocomplete)
-    async def remove_role_permission_slash(interaction: discord.Interaction, role_name: str, command: str):
-        await remove_role_permission_command(interaction, role_name, command)
-
-    @tree.command(name="list_role_members", description="List all people with a given role")
-    @app_commands.describe(role_name="Name of the role")
-    @app_commands.autocomplete(role_name=role_autocomplete)
-    async def list_role_members_slash(interaction: discord.Interaction, role_name: str):
-        await list_role_members_command(interaction, role_name)
-
-    @tree.command(name="add_user_to_role", description="Add a user to a specific role (Owner only)")
-    @app_commands.describe(user="User to add to role", role_name="Name of the role")
-    @app_commands.autocomplete(role_name=role_autocomplete)
-    async def add_user_to_role_slash(interaction: discord.Interaction, user: discord.Member, role_name: str):
-        await add_user_to_role_command(interaction, user, role_name)
-
-    @tree.command(name="remove_user_from_role", description="Remove a user from a specific role (Owner only)")
-    @app_commands.describe(user="User to remove from role", role_name="Name of the role")
-    @app_commands.autocomplete(role_name=role_autocomplete)
-    async def remove_user_from_role_slash(interaction: discord.Interaction, user: discord.Member, role_name: str):
-        await remove_user_from_role_command(interaction, user, role_name)
-
-    @tree.command(name="list_user_roles", description="List all roles for a specific user")
-    @app_commands.describe(user="User to check roles for")
-    async def list_user_roles_slash(interaction: discord.Interaction, user: discord.Member):
-        await list_user_roles_command(interaction, user)
-
-    @tree.command(name="list_all_roles", description="List all roles in the server with details")
-    async def list_all_roles_slash(interaction: discord.Interaction):
-        await list_all_roles_command(interaction)
+    ("create_role", "Create a new role with optional commands (Owner only)", "create_role_command",
+     (_param("role_name", str), _param("commands", str, "")),
+     {"describe": dict(role_name="Name of the role to create", commands="Comma-separated commands (optional)")}),
+    ("delete_role", "Delete a role and update all related data (Owner only)", "delete_role_command",
+     (_param("role_name", str),),
+     {"describe": dict(role_name="Name of the role to delete"),
+      "autocomplete": dict(role_name=role_autocomplete)}),
+    ("list_role_permissions", "List permissions/commands for a specific role", "list_role_permissions_command",
+     (_param("role_name", str),),
+     {"describe": dict(role_name="Name of the role"),
+      "autocomplete": dict(role_name=role_autocomplete)}),
+    ("add_role_permission", "Add a command permission to a role (Owner only)", "add_role_permission_command",
+     (_param("role_name", str), _param("command", str)),
+     {"describe": dict(role_name="Name of the role", command="Command to allow"),
+      "autocomplete": dict(role_name=role_autocomplete, command=command_autocomplete)}),
+    ("remove_role_permission", "Remove a command permission from a role (Owner only)", "remove_role_permission_command",
+     (_param("role_name", str), _param("command", str)),
+     {"describe": dict(role_name="Name of the role", command="Command to remove"),
+      "autocomplete": dict(role_name=role_autocomplete, command=command_autocomplete)}),
+    ("list_role_members", "List all people with a given role", "list_role_members_command",
+     (_param("role_name", str),),
+     {"describe": dict(role_name="Name of the role"),
+      "autocomplete": dict(role_name=role_autocomplete)}),
+    ("add_user_to_role", "Add a user to a specific role (Owner only)", "add_user_to_role_command",
+     (_param("user", discord.Member), _param("role_name", str)),
+     {"describe": dict(user="User to add to role", role_name="Name of the role"),
+      "autocomplete": dict(role_name=role_autocomplete)}),
+    ("remove_user_from_role", "Remove a user from a specific role (Owner only)", "remove_user_from_role_command",
+     (_param("user", discord.Member), _param("role_name", str)),
+     {"describe": dict(user="User to remove from role", role_name="Name of the role"),
+      "autocomplete": dict(role_name=role_autocomplete)}),
+    ("list_user_roles", "List all roles for a specific user", "list_user_roles_command",
+     (_param("user", discord.Member),),
+     {"describe": dict(user="User to check roles for")}),
+    ("list_all_roles", "List all roles in the server with details", "list_all_roles_command", (), {}),
 
     # Free/Busy and Calendar Slot Commands
-    @tree.command(name="find_free_slots", description="Find free time slots in your calendar")
-    @app_commands.describe(start="Start date/time (YYYY-MM-DD HH:MM)", end="End date/time (YYYY-MM-DD HH:MM)", duration="Duration in minutes")
-    async def find_free_slots_slash(interaction: discord.Interaction, start: str, end: str, duration: int = 30):
-        await find_free_slots_command(interaction, start, end, duration)
+    ("find_free_slots", "Find free time slots in your calendar", "find_free_slots_command",
+     (_param("start", str), _param("end", str), _param("duration", int, 30), _param("users", str, "")),
+     {"describe": dict(start="Start date/time (YYYY-MM-DD HH:MM)", end="End date/time (YYYY-MM-DD HH:MM)", duration="Duration in minutes", users="Other users to include (mentions)")}),
+    ("reserve_slot", "Reserve a time slot in your calendar", "reserve_slot_command",
+     (_param("title", str), _param("start", str), _param("end", str)),
+     {"describe": dict(title="Event title", start="Start date/time (YYYY-MM-DD HH:MM)", end="End date/time (YYYY-MM-DD HH:MM)")}),
+)
+
+# Command names come from the registration table (plus the hand-written sync command),
+# so autocomplete uses the same single source as registration
+COMMANDS = tuple(entry[0] for entry in COMMAND_TABLE) + ("sync_commands",)
+
+# Lowercased names and Choice objects are built once instead of on every keystroke
+_COMMANDS_LC = tuple((cmd.lower(), cmd) for cmd in COMMANDS)
+_COMMAND_CHOICES = {cmd: app_commands.Choice(name=cmd, value=cmd) for cmd in COMMANDS}
+# Sorted names let prefix queries (the usual autocomplete case) bisect to the first hit
+_SORTED_COMMANDS = sorted(COMMANDS)
+# Returned as-is before the user has typed anything
+_DEFAULT_COMMAND_CHOICES = [_COMMAND_CHOICES[cmd] for cmd in COMMANDS[:MAX_AUTOCOMPLETE_CHOICES]]
+
+def _make_callback(name: str, handler_name: str, parameters: tuple):
+    """Build a slash-command callback that forwards its options to the named handler positionally"""
+    names = tuple(parameter.name for parameter in parameters)
+    signature = inspect.Signature([_param("interaction", discord.Interaction), *parameters])
+    choice_type = app_commands.Choice
+    handler = None
+
+    async def callback(interaction: discord.Interaction, **options):
+        # Resolve once, then keep the handler in the closure so later dispatches skip the lookup
+        nonlocal handler
+        if handler is None:
+            handler = _resolve(handler_name)
+        # Choice-typed options arrive as Choice objects, or as the plain default when omitted
+        args = [value.value if isinstance(value, choice_type) else value for value in map(options.get, names)]
+        await handler(interaction, *args)
+
+    # app_commands reads the option list from the callback's signature; the annotations and
+    # name mirror what a hand-written `<name>_slash` wrapper would carry for tracebacks/tools
+    callback.__signature__ = signature
+    callback.__annotations__ = {p.name: p.annotation for p in signature.parameters.values()}
+    callback.__name__ = callback.__qualname__ = f"{name}_slash"
+    return callback
+
+def register_all_commands(bot):
+    tree = bot.tree
 
-    @tree.command(name="reserve_slot", description="Reserve a time slot in your calendar")
-    @app_commands.describe(title="Event title", start="Start date/time (YYYY-MM-DD HH:MM)", end="End date/time (YYYY-MM-DD HH:MM)")
-    async def reserve_slot_slash(interaction: discord.Interaction, title: str, start: str, end: str):
-        await reserve_slot_command(interaction, title, start, end)
+    for name, description, handler_name, parameters, decorators in COMMAND_TABLE:
+        callback = _make_callback(name, handler_name, parameters)
+        if "autocomplete" in decorators:
+            callback = app_commands.autocomplete(**decorators["autocomplete"])(callback)
+        if "choices" in decorators:
+            callback = app_commands.choices(**decorators["choices"])(callback)
+        if "describe" in decorators:
+            callback = app_commands.describe(**decorators["describe"])(callback)
+        tree.command(name=name, description=description)(callback)
 
     # Admin Commands
     @tree.command(name="sync_commands", description="Manually sync bot commands with Discord (Owner only)")
@@ -330,12 +367,7 @@ def register_all_commands(bot):
     async def sync_commands_slash(interaction: discord.Interaction, guild_only: bool = False):
         # Only bot owner can sync commands
         if interaction.user.id != bot.owner_id:
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="Only the bot owner can sync commands.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=EMBED_SYNC_DENIED, ephemeral=True)
             return
 
         await interaction.response.defer(ephemeral=True)
@@ -1,10 +1,13 @@
 import discord
 from datetime import datetime, timedelta
+from typing import Optional
 from sqlalchemy.future import select
 from db.session import AsyncSessionLocal
-from db.models import UserToken
-from services.calendar_service import CalendarService
+from db.models import UserToken, UserProfile
+from services.calendar_service import get_calendar_service, invalidate_calendar_service
 import os
+import re
+from urllib.parse import quote
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,10 +15,21 @@ GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
 GOOGLE_REDIRECT_URI = os.getenv('GOOGLE_REDIRECT_URI')
 OAUTH2_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 SCOPES = "https://www.googleapis.com/auth/calendar"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+MENTION_PATTERN = re.compile(r'<@!?(\d+)>')
+# Static responses are built once and shared; they are never mutated after creation
+EMBED_NOT_LINKED = discord.Embed(title="Error", description="You must link your Google Calendar first.", color=discord.Color.red())
+EMBED_INVALID_DATETIME = discord.Embed(title="Error", description="Invalid date/time. Please use format: `YYYY-MM-DD HH:MM`", color=discord.Color.red())
+EMBED_INVALID_RANGE = discord.Embed(title="Error", description="End time must be after start time.", color=discord.Color.red())
+# Everything but the state parameter is fixed, so build (and URL-encode) it once
+OAUTH_URL_PREFIX = (
+    f"{OAUTH2_URL}?client_id={GOOGLE_CLIENT_ID}"
+    f"&redirect_uri={quote(GOOGLE_REDIRECT_URI or '', safe='')}"
+    f"&response_type=code&scope={quote(SCOPES, safe='')}&access_type=offline&state="
+)
 
 async def link_calendar_command(interaction: discord.Interaction):
-    state = str(interaction.user.id)
-    url = f"{OAUTH2_URL}?client_id={GOOGLE_CLIENT_ID}&redirect_uri={GOOGLE_REDIRECT_URI}&response_type=code&scope={SCOPES}&access_type=offline&state={state}"
+    url = OAUTH_URL_PREFIX + str(interaction.user.id)
     try:
         await interaction.user.send(f"Click this link to link your Google Calendar: {url}")
         embed = discord.Embed(title="Check your DMs!", description="A link to link your Google Calendar has been sent.", color=discord.Color.green())
@@ -26,11 +40,12 @@ async def link_calendar_command(interaction: discord.Interaction):
 async def delete_calendar_token_command(interaction: discord.Interaction):
     user_id = interaction.user.id
     async with AsyncSessionLocal() as session:
-        result = await session.execute(select(UserToken).where(UserToken.discord_id == user_id))
-        token = result.scalar_one_or_none()
+        # discord_id is the primary key, so this is an identity-map/PK lookup
+        token = await session.get(UserToken, user_id)
         if token:
             await session.delete(token)
             await session.commit()
+            invalidate_calendar_service(user_id)
             embed = discord.Embed(title="Token Deleted", description="Your Google Calendar token has been deleted.", color=discord.Color.green())
         else:
             embed = discord.Embed(title="No Token", description="No Google Calendar token found.", color=discord.Color.orange())
@@ -39,55 +54,126 @@ async def delete_calendar_token_command(interaction: discord.Interaction):
 async def update_calendar_token_command(interaction: discord.Interaction):
     await link_calendar_command(interaction)
 
-async def find_free_slots_command(interaction: discord.Interaction, start: str, end: str, duration: int = 30):
-    # Only the requesting user sees the results
-    users = [interaction.user] + list(interaction.user.mentioned_in(interaction.channel.history(limit=10)))
-    # For demo, just use the command author
-    start_dt = datetime.fromisoformat(start)
-    end_dt = datetime.fromisoformat(end)
-    async with AsyncSessionLocal() as session:
-        # Get tokens for all users
-        result = await session.execute(select(UserToken).where(UserToken.discord_id == interaction.user.id))
-        token = result.scalar_one_or_none()
-        if not token:
-            embed = discord.Embed(title="Error", description="You must link your Google Calendar first.", color=discord.Color.red())
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        # For demo, just check the requesting user's calendar
-        cal = CalendarService(token.token_data)
-        busy = cal.get_freebusy(interaction.user.name, start_dt, end_dt)
-        # Find free slots
-        slots = []
-        current = start_dt
-        while current + timedelta(minutes=duration) <= end_dt:
-            slot_busy = False
-            for b in busy:
-                busy_start = datetime.fromisoformat(b['start'][:-1])
-                busy_end = datetime.fromisoformat(b['end'][:-1])
-                if not (current + timedelta(minutes=duration) <= busy_start or current >= busy_end):
-                    slot_busy = True
-                    break
-            if not slot_busy:
-                slots.append(current.strftime('%Y-%m-%d %H:%M'))
-            current += timedelta(minutes=duration)
-        if not slots:
-            embed = discord.Embed(title="No Free Slots", description="No common free slots found.", color=discord.Color.orange())
+def parse_command_datetime(value: str) -> Optional[datetime]:
+    """Parse a user-supplied 'YYYY-MM-DD HH:MM' string, or return None if it doesn't match"""
+    try:
+        return datetime.strptime(value.strip(), DATETIME_FORMAT)
+    except ValueError:
+        return None
+
+def parse_busy_timestamp(value: str) -> datetime:
+    """Parse a free/busy timestamp such as '2024-01-15T14:30:00Z' into a naive UTC datetime"""
+    # Google returns fixed-width UTC timestamps, which slice faster than fromisoformat parses
+    if len(value) == 20 and value[-1] == 'Z':
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]))
+    return datetime.fromisoformat(value[:-1])
+
+def merge_busy_intervals(intervals):
+    """Sort (start, end) pairs and merge the ones that overlap or touch"""
+    merged = []
+    for busy_start, busy_end in sorted(intervals):
+        if merged and busy_start <= merged[-1][1]:
+            if busy_end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], busy_end)
         else:
-            embed = discord.Embed(title="Free Slots", description="\n".join(slots), color=discord.Color.green())
+            merged.append((busy_start, busy_end))
+    return merged
+
+async def find_free_slots_command(interaction: discord.Interaction, start: str, end: str, duration: int = 30, users: str = ""):
+    # Only the requesting user sees the results
+    start_dt = parse_command_datetime(start)
+    end_dt = parse_command_datetime(end)
+    if start_dt is None or end_dt is None:
+        await interaction.response.send_message(embed=EMBED_INVALID_DATETIME, ephemeral=True)
+        return
+    if end_dt <= start_dt:
+        await interaction.response.send_message(embed=EMBED_INVALID_RANGE, ephemeral=True)
+        return
+    if duration <= 0:
+        embed = discord.Embed(title="Error", description="Duration must be a positive number of minutes.", color=discord.Color.red())
         await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+    # Other participants come from mentions in the users option, resolved from the member cache
+    members = [interaction.user]
+    if users and interaction.guild:
+        seen_ids = {interaction.user.id}
+        for match in MENTION_PATTERN.finditer(users):
+            member_id = int(match.group(1))
+            if member_id in seen_ids:
+                continue
+            seen_ids.add(member_id)
+            member = interaction.guild.get_member(member_id)
+            if member:
+                members.append(member)
+    # Only hold a DB connection for the token and calendar ID lookups
+    async with AsyncSessionLocal() as session:
+        # discord_id is the primary key, so this is an identity-map/PK lookup
+        token = await session.get(UserToken, interaction.user.id)
+        # Get every participant's linked calendar ID in one query
+        result = await session.execute(select(UserProfile).where(UserProfile.discord_id.in_([m.id for m in members])))
+        calendar_ids = {p.discord_id: p.calendar_email for p in result.scalars().all() if p.calendar_email}
+    if not token:
+        await interaction.response.send_message(embed=EMBED_NOT_LINKED, ephemeral=True)
+        return
+    # Every calendar is read with the author's credentials, so the author falls back to their primary calendar
+    calendar_ids.setdefault(interaction.user.id, "primary")
+    members_by_calendar = {calendar_ids[m.id]: m for m in members if m.id in calendar_ids}
+    unlinked = [m for m in members if m.id not in calendar_ids]
+    # Query every participant's calendar in a single free/busy request
+    cal = get_calendar_service(interaction.user.id, token.token_data)
+    busy_by_calendar, failed = cal.get_freebusy_batch(list(members_by_calendar), start_dt, end_dt)
+    busy = [b for calendar_busy in busy_by_calendar.values() for b in calendar_busy]
+    # Parse busy intervals once and merge overlaps so slots can be swept in order
+    merged = merge_busy_intervals(
+        (parse_busy_timestamp(b['start']), parse_busy_timestamp(b['end']))
+        for b in busy
+    )
+    # The number of candidate slots is known up front, so size the lists once
+    slot_length = timedelta(minutes=duration)
+    slot_count = (end_dt - start_dt) // slot_length
+    candidates = [start_dt + i * slot_length for i in range(slot_count)]
+    # Mark free slots with a two-pointer walk over slots and merged busy intervals
+    is_free = [False] * slot_count
+    bi = 0
+    for i, current in enumerate(candidates):
+        while bi < len(merged) and merged[bi][1] <= current:
+            bi += 1
+        is_free[i] = bi == len(merged) or merged[bi][0] >= current + slot_length
+    slots = [current.strftime(DATETIME_FORMAT) for current, free in zip(candidates, is_free) if free]
+    if not slots:
+        embed = discord.Embed(title="No Free Slots", description="No common free slots found.", color=discord.Color.orange())
+    else:
+        embed = discord.Embed(title="Free Slots", description="\n".join(slots), color=discord.Color.green())
+    # Participants whose busy times are unknown were not checked, so say so rather than treat them as free
+    skipped = unlinked + [members_by_calendar[calendar_id] for calendar_id in failed]
+    if skipped:
+        embed.add_field(
+            name="⚠️ Not Checked",
+            value=", ".join(m.display_name for m in skipped)
+            + "\nThey need to link a calendar with `/link_user_calendar` and share it with you.",
+            inline=False
+        )
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
 async def reserve_slot_command(interaction: discord.Interaction, title: str, start: str, end: str):
     user_id = interaction.user.id
-    start_dt = datetime.fromisoformat(start)
-    end_dt = datetime.fromisoformat(end)
+    start_dt = parse_command_datetime(start)
+    end_dt = parse_command_datetime(end)
+    if start_dt is None or end_dt is None:
+        await interaction.response.send_message(embed=EMBED_INVALID_DATETIME, ephemeral=True)
+        return
+    if end_dt <= start_dt:
+        await interaction.response.send_message(embed=EMBED_INVALID_RANGE, ephemeral=True)
+        return
+    # Only hold a DB connection for the token lookup
     async with AsyncSessionLocal() as session:
-        result = await session.execute(select(UserToken).where(UserToken.discord_id == user_id))
-        token = result.scalar_one_or_none()
-        if not token:
-            embed = discord.Embed(title="Error", description="You must link your Google Calendar first.", color=discord.Color.red())
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        cal = CalendarService(token.token_data)
-        event_id = cal.create_event(interaction.user.name, title, start_dt, end_dt)
-        embed = discord.Embed(title="Event Reserved", description=f"Event '{title}' reserved in your calendar.", color=discord.Color.green())
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        # discord_id is the primary key, so this is an identity-map/PK lookup
+        token = await session.get(UserToken, user_id)
+    if not token:
+        await interaction.response.send_message(embed=EMBED_NOT_LINKED, ephemeral=True)
+        return
+    cal = get_calendar_service(user_id, token.token_data)
+    event_id = cal.create_event(interaction.user.name, title, start_dt, end_dt)
+    embed = discord.Embed(title="Event Reserved", description=f"Event '{title}' reserved in your calendar.", color=discord.Color.green())
+    await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -1,14 +1,15 @@
 import discord
 from discord import app_commands
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 import re
+from functools import lru_cache
 from sqlalchemy.future import select
-from db.session import AsyncSessionLocal
 from db.models import UserProfile
 from services.calendar_service import CalendarService
 from services.calendar_manager import CalendarManager
+from utils.interactions import require_defer
 
 # Calendar sharing instructions
 CALENDAR_SHARING_INSTRUCTIONS = """
@@ -35,94 +36,192 @@ CALENDAR_SHARING_INSTRUCTIONS = """
 **🔗 Need help?** Contact an admin or use `/calendar_help` for more info.
 """
 
+# Embed colors shared by every response in this module
+COLOR_ERROR = discord.Color.red()
+COLOR_SUCCESS = discord.Color.green()
+COLOR_INFO = discord.Color.blue()
+
+async def send_embed(interaction: discord.Interaction, embed: discord.Embed):
+    """Send an ephemeral embed, as a followup if the interaction was already deferred"""
+    if interaction.response.is_done():
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    else:
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def send_error(interaction: discord.Interaction, title: str, description: str):
+    """Send an ephemeral error embed"""
+    await send_embed(interaction, discord.Embed(title=title, description=description, color=COLOR_ERROR))
+
+# Error responses with fixed content are built once; they are never mutated after creation
+EMBED_MISSING_CALENDAR_ID = discord.Embed(
+    title="❌ Missing Calendar ID",
+    description="You need to provide your Google Calendar ID to link it.",
+    color=COLOR_ERROR
+)
+EMBED_MISSING_CALENDAR_ID.add_field(name="📋 Instructions", value=CALENDAR_SHARING_INSTRUCTIONS, inline=False)
+EMBED_UPDATE_FAILED = discord.Embed(title="❌ Update Failed", description="Failed to update the event.", color=COLOR_ERROR)
+EMBED_DELETE_FAILED = discord.Embed(title="❌ Deletion Failed", description="Failed to delete the event.", color=COLOR_ERROR)
+
+MENTION_PATTERN = re.compile(r'<@!?(\d+)>')
+# Maximum number of events shown by /list_events
+LIST_EVENTS_LIMIT = 10
+# Maximum number of invitation DMs in flight at once
+INVITATION_CONCURRENCY = 8
+# Maximum length of an embed field value
+EMBED_FIELD_LIMIT = 1024
+# Basic email-like format used by Google Calendar IDs
+CALENDAR_ID_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+def parse_user_tokens(users: str) -> frozenset:
+    """Normalize a users option into IDs and names so members can be matched by set lookup.
+
+    Accepts mentions, raw IDs and `@name`/`name` entries separated by commas. Without
+    commas, whitespace separates mentions, IDs and `@name` entries only.
+    """
+    tokens = set(MENTION_PATTERN.findall(users))
+    remainder = MENTION_PATTERN.sub(" ", users)
+    # Never split both ways: comma-separated names may contain spaces, and splitting
+    # "John Smith" into words would match (and grant access to) unrelated members
+    if ',' in remainder:
+        parts = remainder.split(',')
+    else:
+        parts = [part for part in remainder.split() if part.startswith('@') or part.isdigit()]
+    for part in parts:
+        part = part.strip().lstrip('@').strip()
+        if part:
+            tokens.add(part)
+    return frozenset(tokens)
+
+# Users tend to re-enter the same dates and times, so parsed values are memoized;
+# datetime/date objects are immutable, and invalid input still raises ValueError
+@lru_cache(maxsize=512)
+def parse_event_datetime(value: str) -> datetime:
+    """Parse an event time given as `YYYY-MM-DD HH:MM` or `YYYY-MM-DDTHH:MM`"""
+    # Slice the fixed-width layout the commands document; anything else (seconds,
+    # offsets, bad input) goes through the general parser
+    if (len(value) == 16 and value[4] == '-' and value[7] == '-' and value[10] in ' T'
+            and value[13] == ':' and value[:4].isdigit() and value[5:7].isdigit()
+            and value[8:10].isdigit() and value[11:13].isdigit() and value[14:].isdigit()):
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:]))
+    return datetime.fromisoformat(value)
+
+@lru_cache(maxsize=512)
+def parse_day(value: str) -> date:
+    """Parse a `YYYY-MM-DD` day"""
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def chunk_by_lines(text: str, limit: int = EMBED_FIELD_LIMIT):
+    """Yield pieces of text of at most `limit` characters, splitting only between lines"""
+    lines = []
+    size = 0
+    for line in text.splitlines(keepends=True):
+        if lines and size + len(line) > limit:
+            yield "".join(lines)
+            lines = []
+            size = 0
+        lines.append(line)
+        size += len(line)
+    if lines:
+        yield "".join(lines)
+
+def resolve_target_members(guild: discord.Guild, roles: str, users: str) -> list:
+    """Resolve the roles and users options to a de-duplicated list of guild members.
+
+    Roles are expanded through Discord's cached role membership and users are looked up
+    by ID or through a name index, so guild.members is scanned at most once.
+    """
+    targets = {}
+    if roles.strip():
+        roles_by_name = {role.name: role for role in guild.roles}
+        for role_name in (r.strip() for r in roles.split(",")):
+            role = roles_by_name.get(role_name)
+            if role:
+                targets.update((member.id, member) for member in role.members)
+
+    if users.strip():
+        names = set()
+        for token in parse_user_tokens(users):
+            member = guild.get_member(int(token)) if token.isdigit() else None
+            if member:
+                targets[member.id] = member
+            else:
+                names.add(token)
+        if names:
+            for member in guild.members:
+                if member.id not in targets and (member.name in names or member.display_name in names):
+                    targets[member.id] = member
+
+    return list(targets.values())
+
+# The help content is static, so the embed is built once at import and reused
+CALENDAR_HELP_EMBED = discord.Embed(
+    title="📅 Calendar System Help",
+    description=CALENDAR_SHARING_INSTRUCTIONS,
+    color=COLOR_INFO
+)
+
+# Personal Calendar Commands
+CALENDAR_HELP_EMBED.add_field(
+    name="👤 Personal Calendar Commands",
+    value="• `/link_user_calendar <calendar_id>` - Link your Google Calendar\n• `/calendar_help` - Show this help",
+    inline=False
+)
+
+# Admin Calendar Management
+CALENDAR_HELP_EMBED.add_field(
+    name="🔧 Admin Calendar Management",
+    value="• `/create_shared_calendar <name> [description]` - Create shared calendar\n• `/add_calendar_users <calendar> <permission> [roles] [users]` - Add users\n• `/list_calendar_users <calendar>` - List calendar access\n• `/remove_calendar_users <calendar> [roles] [users]` - Remove users",
+    inline=False
+)
+
+# Event Management
+CALENDAR_HELP_EMBED.add_field(
+    name="📅 Event Management",
+    value="• `/add_event <calendar> <name> <start> <end> [location] [description] [roles]` - Create event\n• `/list_events <calendar> [days_ahead]` - List upcoming events\n• `/update_event <calendar> <event_id> [name] [start] [end] [location] [description]` - Update event\n• `/delete_event <calendar> <event_id>` - Delete event",
+    inline=False
+)
+
+# Calendar Visualization
+CALENDAR_HELP_EMBED.add_field(
+    name="📊 Calendar Visualization",
+    value="• `/visualize_day <calendar> <date> [start_hour] [end_hour]` - Show day schedule",
+    inline=False
+)
+
+# Permission Levels
+CALENDAR_HELP_EMBED.add_field(
+    name="🔐 Permission Levels",
+    value="• **Owner** - Full access (create, edit, delete, manage users)\n• **Writer** - Can create and edit events\n• **Reader** - Can only view events",
+    inline=False
+)
+
 async def calendar_help_command(interaction: discord.Interaction):
     """Show instructions for calendar sharing and available commands"""
-    embed = discord.Embed(
-        title="📅 Calendar System Help",
-        description=CALENDAR_SHARING_INSTRUCTIONS,
-        color=discord.Color.blue()
-    )
-
-    # Personal Calendar Commands
-    embed.add_field(
-        name="👤 Personal Calendar Commands",
-        value="• `/link_user_calendar <calendar_id>` - Link your Google Calendar\n• `/calendar_help` - Show this help",
-        inline=False
-    )
-
-    # Admin Calendar Management
-    embed.add_field(
-        name="🔧 Admin Calendar Management",
-        value="• `/create_shared_calendar <name> [description]` - Create shared calendar\n• `/add_calendar_users <calendar> <permission> [roles] [users]` - Add users\n• `/list_calendar_users <calendar>` - List calendar access\n• `/remove_calendar_users <calendar> [roles] [users]` - Remove users",
-        inline=False
-    )
-
-    # Event Management
-    embed.add_field(
-        name="📅 Event Management",
-        value="• `/add_event <calendar> <name> <start> <end> [location] [description] [roles]` - Create event\n• `/list_events <calendar> [days_ahead]` - List upcoming events\n• `/update_event <calendar> <event_id> [name] [start] [end] [location] [description]` - Update event\n• `/delete_event <calendar> <event_id>` - Delete event",
-        inline=False
-    )
-
-    # Calendar Visualization
-    embed.add_field(
-        name="📊 Calendar Visualization",
-        value="• `/visualize_day <calendar> <date> [start_hour] [end_hour]` - Show day schedule",
-        inline=False
-    )
-
-    # Permission Levels
-    embed.add_field(
-        name="🔐 Permission Levels",
-        value="• **Owner** - Full access (create, edit, delete, manage users)\n• **Writer** - Can create and edit events\n• **Reader** - Can only view events",
-        inline=False
-    )
-
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    await interaction.response.send_message(embed=CALENDAR_HELP_EMBED, ephemeral=True)
 
 async def link_user_calendar_command(interaction: discord.Interaction, calendar_id: str = ""):
     """Link user's personal Google Calendar"""
     if not calendar_id.strip():
         # Show instructions if no calendar_id provided
-        embed = discord.Embed(
-            title="❌ Missing Calendar ID",
-            description="You need to provide your Google Calendar ID to link it.",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="📋 Instructions",
-            value=CALENDAR_SHARING_INSTRUCTIONS,
-            inline=False
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=EMBED_MISSING_CALENDAR_ID, ephemeral=True)
         return
 
     bot = interaction.client
 
     try:
         # Validate calendar ID format (basic email-like format)
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', calendar_id):
-            embed = discord.Embed(
-                title="❌ Invalid Calendar ID",
-                description="Calendar ID should look like an email address (e.g., `example@gmail.com`)",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if not CALENDAR_ID_PATTERN.match(calendar_id):
+            await send_error(interaction, "❌ Invalid Calendar ID", "Calendar ID should look like an email address (e.g., `example@gmail.com`)")
             return
 
         # Update user profile with calendar ID
-        async with AsyncSessionLocal() as session:
-            user_profile = await bot.user_manager.get_user(interaction.user.id)
-            if not user_profile:
-                user_profile = await bot.user_manager.ensure_user(interaction.user.id, calendar_email=calendar_id)
-            else:
-                user_profile.calendar_email = calendar_id
-                await session.commit()
+        await bot.user_manager.set_calendar_email(interaction.user.id, calendar_id)
 
         embed = discord.Embed(
             title="✅ Calendar Linked Successfully",
             description=f"Your Google Calendar has been linked!\n\n**Calendar ID:** `{calendar_id}`",
-            color=discord.Color.green()
+            color=COLOR_SUCCESS
         )
         embed.add_field(
             name="What's Next?",
@@ -132,37 +231,23 @@ async def link_user_calendar_command(interaction: discord.Interaction, calendar_
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Linking Calendar",
-            description=f"Failed to link calendar: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Linking Calendar", f"Failed to link calendar: {str(e)}")
 
+@require_defer
 async def create_shared_calendar_command(interaction: discord.Interaction, calendar_name: str, description: str = ""):
     """Create a shared calendar (Admin only)"""
     bot = interaction.client
 
     # Only server owner can create shared calendars
     if interaction.user.id != bot.owner_id:
-        embed = discord.Embed(
-            title="❌ Permission Denied",
-            description="Only the server owner can create shared calendars.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Permission Denied", "Only the server owner can create shared calendars.")
         return
 
     try:
         # Check if calendar already exists
         existing_calendar = await bot.calendar_manager.get_calendar(calendar_name)
         if existing_calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Already Exists",
-                description=f"A calendar named '{calendar_name}' already exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Calendar Already Exists", f"A calendar named '{calendar_name}' already exists.")
             return
 
         # Create calendar using CalendarManager
@@ -176,7 +261,7 @@ async def create_shared_calendar_command(interaction: discord.Interaction, calen
         embed = discord.Embed(
             title="✅ Shared Calendar Created",
             description=f"Successfully created shared calendar: **{calendar_name}**",
-            color=discord.Color.green()
+            color=COLOR_SUCCESS
         )
         embed.add_field(name="📅 Calendar ID", value=str(calendar.id), inline=True)
         embed.add_field(name="📝 Description", value=description or "No description", inline=True)
@@ -187,125 +272,84 @@ async def create_shared_calendar_command(interaction: discord.Interaction, calen
             inline=False
         )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Creating Calendar",
-            description=f"Failed to create calendar: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Creating Calendar", f"Failed to create calendar: {str(e)}")
 
+@require_defer
 async def add_calendar_users_command(interaction: discord.Interaction, calendar_name: str, permission: str, roles: str = "", users: str = ""):
     """Add users to shared calendar with specific permissions (Admin only)"""
     bot = interaction.client
 
     # Only server owner can manage calendar permissions
     if interaction.user.id != bot.owner_id:
-        embed = discord.Embed(
-            title="❌ Permission Denied",
-            description="Only the server owner can manage calendar permissions.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Permission Denied", "Only the server owner can manage calendar permissions.")
         return
 
     # Validate permission level
     valid_permissions = ["reader", "writer", "owner"]
     if permission.lower() not in valid_permissions:
-        embed = discord.Embed(
-            title="❌ Invalid Permission",
-            description=f"Permission must be one of: {', '.join(valid_permissions)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Invalid Permission", f"Permission must be one of: {', '.join(valid_permissions)}")
         return
 
     if not roles.strip() and not users.strip():
-        embed = discord.Embed(
-            title="❌ Missing Users or Roles",
-            description="You must specify either roles or users to add to the calendar.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Missing Users or Roles", "You must specify either roles or users to add to the calendar.")
         return
 
     try:
         # Get the calendar
         calendar = await bot.calendar_manager.get_calendar(calendar_name)
         if not calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Not Found",
-                description=f"No calendar named '{calendar_name}' exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Calendar Not Found", f"No calendar named '{calendar_name}' exists.")
             return
 
         guild = interaction.guild
-        added_users = []
-
-        # Process roles
-        if roles.strip():
-            role_names = [r.strip() for r in roles.split(",") if r.strip()]
-            role_added_users = await bot.calendar_manager.add_users_by_roles(
-                calendar.id, role_names, permission, interaction.user.id, guild.members
-            )
-            added_users.extend([guild.get_member(user_id) for user_id in role_added_users if guild.get_member(user_id)])
-
-        # Process individual users
-        if users.strip():
-            for member in guild.members:
-                if (f"@{member.display_name}" in users or
-                    f"@{member.name}" in users or
-                    str(member.id) in users or
-                    member.mention in users):
-                    success = await bot.calendar_manager.add_permission(
-                        calendar.id, member.id, permission, interaction.user.id
-                    )
-                    if success and member not in added_users:
-                        added_users.append(member)
 
+        # Resolve roles and users to one member set, then grant in one statement
+        added_users = resolve_target_members(guild, roles, users)
         if not added_users:
-            embed = discord.Embed(
-                title="❌ No Users Found",
-                description="No valid users or roles were found to add to the calendar.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ No Users Found", "No valid users or roles were found to add to the calendar.")
             return
 
-        # Send invitation messages to users
-        invitation_count = 0
-        for user in added_users:
-            try:
-                # Send DM invitation
-                embed_invite = discord.Embed(
-                    title="📅 Calendar Invitation",
-                    description=f"You've been added to the shared calendar: **{calendar_name}**",
-                    color=discord.Color.blue()
-                )
-                embed_invite.add_field(name="🔐 Permission Level", value=permission.title(), inline=True)
-                embed_invite.add_field(name="🏠 Server", value=guild.name, inline=True)
-                embed_invite.add_field(
-                    name="📋 What You Can Do",
-                    value="• View calendar events\n• Receive event notifications\n• Use calendar commands" +
-                          ("\n• Create and edit events" if permission in ["writer", "owner"] else "") +
-                          ("\n• Manage calendar users" if permission == "owner" else ""),
-                    inline=False
-                )
+        await bot.calendar_manager.add_permissions_bulk(
+            calendar.id, [member.id for member in added_users], permission, interaction.user.id
+        )
+
+        # The invitation is the same for every user, so build it once
+        embed_invite = discord.Embed(
+            title="📅 Calendar Invitation",
+            description=f"You've been added to the shared calendar: **{calendar_name}**",
+            color=COLOR_INFO
+        )
+        embed_invite.add_field(name="🔐 Permission Level", value=permission.title(), inline=True)
+        embed_invite.add_field(name="🏠 Server", value=guild.name, inline=True)
+        embed_invite.add_field(
+            name="📋 What You Can Do",
+            value="• View calendar events\n• Receive event notifications\n• Use calendar commands" +
+                  ("\n• Create and edit events" if permission in ["writer", "owner"] else "") +
+                  ("\n• Manage calendar users" if permission == "owner" else ""),
+            inline=False
+        )
+
+        # Send DM invitations concurrently, a few at a time to stay within rate limits
+        dm_semaphore = asyncio.Semaphore(INVITATION_CONCURRENCY)
+
+        async def send_invitation(user) -> int:
+            async with dm_semaphore:
+                try:
+                    await user.send(embed=embed_invite)
+                    return 1
+                except Exception:
+                    # If DM fails, continue with others
+                    return 0
 
-                await user.send(embed=embed_invite)
-                invitation_count += 1
-            except:
-                # If DM fails, continue with others
-                pass
+        invitation_count = sum(await asyncio.gather(*(send_invitation(user) for user in added_users)))
 
         embed = discord.Embed(
             title="✅ Users Added to Calendar",
             description=f"Successfully added {len(added_users)} users to calendar **{calendar_name}**",
-            color=discord.Color.green()
+            color=COLOR_SUCCESS
         )
         embed.add_field(name="🔐 Permission Level", value=permission.title(), inline=True)
         embed.add_field(name="📧 Invitations Sent", value=f"{invitation_count}/{len(added_users)}", inline=True)
@@ -315,16 +359,12 @@ async def add_calendar_users_command(interaction: discord.Interaction, calendar_
             user_list += f" and {len(added_users) - 10} more..."
         embed.add_field(name="👥 Added Users", value=user_list, inline=False)
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Adding Users",
-            description=f"Failed to add users to calendar: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Adding Users", f"Failed to add users to calendar: {str(e)}")
 
+@require_defer
 async def list_calendar_users_command(interaction: discord.Interaction, calendar_name: str):
     """List users with access to a shared calendar"""
     bot = interaction.client
@@ -333,20 +373,15 @@ async def list_calendar_users_command(interaction: discord.Interaction, calendar
         # Get the calendar
         calendar = await bot.calendar_manager.get_calendar(calendar_name)
         if not calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Not Found",
-                description=f"No calendar named '{calendar_name}' exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Calendar Not Found", f"No calendar named '{calendar_name}' exists.")
             return
 
-        # Get users with permissions
-        permissions = await bot.calendar_manager.get_calendar_users(calendar.id)
+        # get_calendar eagerly loads the permission rows, so no second query is needed
+        permissions = calendar.permissions
 
         embed = discord.Embed(
             title=f"👥 Users with access to: {calendar_name}",
-            color=discord.Color.blue()
+            color=COLOR_INFO
         )
 
         # Group by permission level
@@ -399,77 +434,42 @@ async def list_calendar_users_command(interaction: discord.Interaction, calendar
             inline=False
         )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Listing Users",
-            description=f"Failed to list calendar users: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Listing Users", f"Failed to list calendar users: {str(e)}")
 
+@require_defer
 async def remove_calendar_users_command(interaction: discord.Interaction, calendar_name: str, roles: str = "", users: str = ""):
     """Remove users from shared calendar (Admin only)"""
     bot = interaction.client
 
     # Only server owner can manage calendar permissions
     if interaction.user.id != bot.owner_id:
-        embed = discord.Embed(
-            title="❌ Permission Denied",
-            description="Only the server owner can manage calendar permissions.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Permission Denied", "Only the server owner can manage calendar permissions.")
         return
 
     if not roles.strip() and not users.strip():
-        embed = discord.Embed(
-            title="❌ Missing Users or Roles",
-            description="You must specify either roles or users to remove from the calendar.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Missing Users or Roles", "You must specify either roles or users to remove from the calendar.")
         return
 
     try:
         # Get the calendar
         calendar = await bot.calendar_manager.get_calendar(calendar_name)
         if not calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Not Found",
-                description=f"No calendar named '{calendar_name}' exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Calendar Not Found", f"No calendar named '{calendar_name}' exists.")
             return
 
-        guild = interaction.guild
+        # Resolve roles and users to one member set so nobody is removed twice
         removed_users = []
-
-        # Process roles
-        if roles.strip():
-            role_names = [r.strip() for r in roles.split(",") if r.strip()]
-            role_removed_users = await bot.calendar_manager.remove_users_by_roles(
-                calendar.id, role_names, guild.members
-            )
-            removed_users.extend([guild.get_member(user_id) for user_id in role_removed_users if guild.get_member(user_id)])
-
-        # Process individual users
-        if users.strip():
-            for member in guild.members:
-                if (f"@{member.display_name}" in users or
-                    f"@{member.name}" in users or
-                    str(member.id) in users or
-                    member.mention in users):
-                    success = await bot.calendar_manager.remove_permission(calendar.id, member.id)
-                    if success and member not in removed_users:
-                        removed_users.append(member)
+        for member in resolve_target_members(interaction.guild, roles, users):
+            if await bot.calendar_manager.remove_permission(calendar.id, member.id):
+                removed_users.append(member)
 
         embed = discord.Embed(
             title="✅ Users Removed from Calendar",
             description=f"Successfully removed {len(removed_users)} users from calendar **{calendar_name}**",
-            color=discord.Color.green()
+            color=COLOR_SUCCESS
         )
 
         if removed_users:
@@ -478,62 +478,38 @@ async def remove_calendar_users_command(interaction: discord.Interaction, calend
                 user_list += f" and {len(removed_users) - 10} more..."
             embed.add_field(name="👥 Removed Users", value=user_list, inline=False)
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Removing Users",
-            description=f"Failed to remove users from calendar: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Removing Users", f"Failed to remove users from calendar: {str(e)}")
 
+@require_defer
 async def add_event_command(interaction: discord.Interaction, calendar_name: str, event_name: str, start_time: str, end_time: str, location: str = "", description: str = "", roles: str = ""):
     """Add event to shared calendar"""
     bot = interaction.client
 
     try:
         # Get the calendar
-        calendar = await bot.calendar_manager.get_calendar(calendar_name)
+        calendar, permission_level = await bot.calendar_manager.get_calendar_with_permission(calendar_name, interaction.user.id)
         if not calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Not Found",
-                description=f"No calendar named '{calendar_name}' exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Calendar Not Found", f"No calendar named '{calendar_name}' exists.")
             return
 
         # Check if user has write permission
-        if not await bot.calendar_manager.has_permission(calendar.id, interaction.user.id, "writer"):
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You need writer or owner permission to add events to this calendar.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if not bot.calendar_manager.meets_permission(permission_level, "writer"):
+            await send_error(interaction, "❌ Permission Denied", "You need writer or owner permission to add events to this calendar.")
             return
 
         # Parse datetime strings
         try:
-            start_dt = datetime.fromisoformat(start_time.replace('T', ' '))
-            end_dt = datetime.fromisoformat(end_time.replace('T', ' '))
+            start_dt = parse_event_datetime(start_time)
+            end_dt = parse_event_datetime(end_time)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Invalid Date Format",
-                description="Please use format: `YYYY-MM-DD HH:MM` or `YYYY-MM-DDTHH:MM`\n\nExample: `2024-01-15 14:30` or `2024-01-15T14:30`",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Invalid Date Format", "Please use format: `YYYY-MM-DD HH:MM` or `YYYY-MM-DDTHH:MM`\n\nExample: `2024-01-15 14:30` or `2024-01-15T14:30`")
             return
 
         if end_dt <= start_dt:
-            embed = discord.Embed(
-                title="❌ Invalid Time Range",
-                description="End time must be after start time.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Invalid Time Range", "End time must be after start time.")
             return
 
         # Create event
@@ -550,7 +526,7 @@ async def add_event_command(interaction: discord.Interaction, calendar_name: str
         embed = discord.Embed(
             title="✅ Event Created",
             description=f"Successfully created event: **{event_name}**",
-            color=discord.Color.green()
+            color=COLOR_SUCCESS
         )
         embed.add_field(name="📅 Calendar", value=calendar_name, inline=True)
         embed.add_field(name="🆔 Event ID", value=str(event.id), inline=True)
@@ -566,19 +542,18 @@ async def add_event_command(interaction: discord.Interaction, calendar_name: str
         if roles.strip():
             guild = interaction.guild
             role_names = [r.strip() for r in roles.split(",") if r.strip()]
-            attendee_count = 0
             personal_calendar_syncs = 0
 
+            # Collect (user, role) pairs for every role member and insert them in one statement
+            attendees = []
+            roles_by_name = {role.name: role for role in guild.roles}
             for role_name in role_names:
-                discord_role = discord.utils.get(guild.roles, name=role_name)
+                discord_role = roles_by_name.get(role_name)
                 if discord_role:
-                    for member in discord_role.members:
-                        success = await bot.calendar_manager.add_event_attendee(
-                            event.id, member.id, role_name
-                        )
-                        if success:
-                            attendee_count += 1
+                    attendees.extend((member.id, role_name) for member in discord_role.members)
+            attendee_count = await bot.calendar_manager.add_event_attendees_bulk(event.id, attendees)
 
+            # Attendees must exist before syncing, so this runs after the insert
             # Check how many users have the event synced to personal calendars
             sync_results = await bot.calendar_manager.sync_event_to_personal_calendars(event.id)
             personal_calendar_syncs = sum(1 for synced in sync_results.values() if synced)
@@ -598,57 +573,48 @@ async def add_event_command(interaction: discord.Interaction, calendar_name: str
                     inline=False
                 )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Creating Event",
-            description=f"Failed to create event: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Creating Event", f"Failed to create event: {str(e)}")
 
+@require_defer
 async def list_events_command(interaction: discord.Interaction, calendar_name: str, days_ahead: int = 7):
     """List upcoming events in a calendar"""
     bot = interaction.client
 
     try:
-        # Get the calendar
+        # Get the calendar (usually served from the calendar manager's cache)
         calendar = await bot.calendar_manager.get_calendar(calendar_name)
         if not calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Not Found",
-                description=f"No calendar named '{calendar_name}' exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-
-        # Check if user has read permission
-        if not await bot.calendar_manager.has_permission(calendar.id, interaction.user.id, "reader"):
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You don't have permission to view events in this calendar.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Calendar Not Found", f"No calendar named '{calendar_name}' exists.")
             return
 
         now = datetime.now()
         end_date = now + timedelta(days=days_ahead)
 
-        events = await bot.calendar_manager.get_calendar_events(
-            calendar.id, start_date=now, end_date=end_date
+        # Both queries only need the calendar ID, so run the permission check and the
+        # event fetch concurrently; the events are discarded if the check fails
+        has_access, events = await asyncio.gather(
+            bot.calendar_manager.has_permission(calendar.id, interaction.user.id, "reader"),
+            bot.calendar_manager.get_calendar_events(
+                calendar.id, start_date=now, end_date=end_date, limit=LIST_EVENTS_LIMIT
+            )
         )
 
+        # Check if user has read permission
+        if not has_access:
+            await send_error(interaction, "❌ Permission Denied", "You don't have permission to view events in this calendar.")
+            return
+
         embed = discord.Embed(
             title=f"📅 Upcoming Events: {calendar_name}",
             description=f"Events from {now.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-            color=discord.Color.blue()
+            color=COLOR_INFO
         )
 
         if events:
-            for i, event in enumerate(events[:10], 1):
+            for i, event in enumerate(events, 1):
                 event_info = f"🕐 {event.start_time.strftime('%Y-%m-%d %H:%M')} - {event.end_time.strftime('%H:%M')}"
                 if event.location:
                     event_info += f"\n📍 {event.location}"
@@ -665,16 +631,12 @@ async def list_events_command(interaction: discord.Interaction, calendar_name: s
             inline=False
         )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Listing Events",
-            description=f"Failed to list events: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Listing Events", f"Failed to list events: {str(e)}")
 
+@require_defer
 async def update_event_command(interaction: discord.Interaction, calendar_name: str, event_id: str, event_name: str = "", start_time: str = "", end_time: str = "", location: str = "", description: str = ""):
     """Update an existing event"""
     bot = interaction.client
@@ -682,75 +644,51 @@ async def update_event_command(interaction: discord.Interaction, calendar_name:
     try:
         event_id_int = int(event_id)
     except ValueError:
-        embed = discord.Embed(
-            title="❌ Invalid Event ID",
-            description="Event ID must be a number.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Invalid Event ID", "Event ID must be a number.")
         return
 
     if not any([event_name, start_time, end_time, location, description]):
-        embed = discord.Embed(
-            title="❌ No Changes Specified",
-            description="You must specify at least one field to update.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ No Changes Specified", "You must specify at least one field to update.")
         return
 
     try:
         # Get the event
-        event = await bot.calendar_manager.get_event(event_id_int)
+        event, permission_level = await bot.calendar_manager.get_event_with_permission(event_id_int, interaction.user.id)
         if not event:
-            embed = discord.Embed(
-                title="❌ Event Not Found",
-                description=f"No event found with ID: {event_id}",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Event Not Found", f"No event found with ID: {event_id}")
             return
 
         # Check if user has write permission
-        if not await bot.calendar_manager.has_permission(event.calendar_id, interaction.user.id, "writer"):
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You need writer or owner permission to update events in this calendar.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if not bot.calendar_manager.meets_permission(permission_level, "writer"):
+            await send_error(interaction, "❌ Permission Denied", "You need writer or owner permission to update events in this calendar.")
             return
 
-        # Prepare update data
+        # Prepare update data, describing each change as it is added
         update_data = {}
+        changes = []
         if event_name:
             update_data['title'] = event_name
+            changes.append(f"Title: {event_name}")
         if start_time:
             try:
-                update_data['start_time'] = datetime.fromisoformat(start_time.replace('T', ' '))
+                update_data['start_time'] = parse_event_datetime(start_time)
             except ValueError:
-                embed = discord.Embed(
-                    title="❌ Invalid Start Time Format",
-                    description="Please use format: `YYYY-MM-DD HH:MM`",
-                    color=discord.Color.red()
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await send_error(interaction, "❌ Invalid Start Time Format", "Please use format: `YYYY-MM-DD HH:MM`")
                 return
+            changes.append(f"Start Time: {update_data['start_time'].strftime('%Y-%m-%d %H:%M')}")
         if end_time:
             try:
-                update_data['end_time'] = datetime.fromisoformat(end_time.replace('T', ' '))
+                update_data['end_time'] = parse_event_datetime(end_time)
             except ValueError:
-                embed = discord.Embed(
-                    title="❌ Invalid End Time Format",
-                    description="Please use format: `YYYY-MM-DD HH:MM`",
-                    color=discord.Color.red()
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await send_error(interaction, "❌ Invalid End Time Format", "Please use format: `YYYY-MM-DD HH:MM`")
                 return
+            changes.append(f"End Time: {update_data['end_time'].strftime('%Y-%m-%d %H:%M')}")
         if location:
             update_data['location'] = location
+            changes.append(f"Location: {location}")
         if description:
             update_data['description'] = description
+            changes.append(f"Description: {description}")
 
         # Update the event
         success = await bot.calendar_manager.update_event(event_id_int, **update_data)
@@ -759,36 +697,20 @@ async def update_event_command(interaction: discord.Interaction, calendar_name:
             embed = discord.Embed(
                 title="✅ Event Updated",
                 description=f"Successfully updated event: **{event.title}**",
-                color=discord.Color.green()
+                color=COLOR_SUCCESS
             )
             embed.add_field(name="📅 Calendar", value=calendar_name, inline=True)
             embed.add_field(name="🆔 Event ID", value=event_id, inline=True)
-
-            changes = []
-            for field, value in update_data.items():
-                if field == 'start_time' or field == 'end_time':
-                    changes.append(f"{field.replace('_', ' ').title()}: {value.strftime('%Y-%m-%d %H:%M')}")
-                else:
-                    changes.append(f"{field.replace('_', ' ').title()}: {value}")
-
             embed.add_field(name="🔄 Changes Made", value="\n".join(changes), inline=False)
         else:
-            embed = discord.Embed(
-                title="❌ Update Failed",
-                description="Failed to update the event.",
-                color=discord.Color.red()
-            )
+            embed = EMBED_UPDATE_FAILED
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Updating Event",
-            description=f"Failed to update event: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Updating Event", f"Failed to update event: {str(e)}")
 
+@require_defer
 async def delete_event_command(interaction: discord.Interaction, calendar_name: str, event_id: str):
     """Delete an event from the calendar"""
     bot = interaction.client
@@ -796,34 +718,19 @@ async def delete_event_command(interaction: discord.Interaction, calendar_name:
     try:
         event_id_int = int(event_id)
     except ValueError:
-        embed = discord.Embed(
-            title="❌ Invalid Event ID",
-            description="Event ID must be a number.",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Invalid Event ID", "Event ID must be a number.")
         return
 
     try:
         # Get the event
-        event = await bot.calendar_manager.get_event(event_id_int)
+        event, permission_level = await bot.calendar_manager.get_event_with_permission(event_id_int, interaction.user.id)
         if not event:
-            embed = discord.Embed(
-                title="❌ Event Not Found",
-                description=f"No event found with ID: {event_id}",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Event Not Found", f"No event found with ID: {event_id}")
             return
 
         # Check if user has write permission
-        if not await bot.calendar_manager.has_permission(event.calendar_id, interaction.user.id, "writer"):
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You need writer or owner permission to delete events from this calendar.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if not bot.calendar_manager.meets_permission(permission_level, "writer"):
+            await send_error(interaction, "❌ Permission Denied", "You need writer or owner permission to delete events from this calendar.")
             return
 
         # Delete the event
@@ -833,146 +740,102 @@ async def delete_event_command(interaction: discord.Interaction, calendar_name:
             embed = discord.Embed(
                 title="✅ Event Deleted",
                 description=f"Successfully deleted event: **{event.title}**",
-                color=discord.Color.green()
+                color=COLOR_SUCCESS
             )
             embed.add_field(name="📅 Calendar", value=calendar_name, inline=True)
             embed.add_field(name="🆔 Event ID", value=event_id, inline=True)
             embed.add_field(name="ℹ️ Note", value="Event has been removed from all associated personal calendars", inline=False)
         else:
-            embed = discord.Embed(
-                title="❌ Deletion Failed",
-                description="Failed to delete the event.",
-                color=discord.Color.red()
-            )
+            embed = EMBED_DELETE_FAILED
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Deleting Event",
-            description=f"Failed to delete event: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Deleting Event", f"Failed to delete event: {str(e)}")
 
+@require_defer
 async def visualize_day_command(interaction: discord.Interaction, calendar_name: str, date: str, start_hour: int = 8, end_hour: int = 18):
     """Visualize a specific day with events in a nice format"""
     bot = interaction.client
 
     try:
-        # Get the calendar
-        calendar = await bot.calendar_manager.get_calendar(calendar_name)
-        if not calendar:
-            embed = discord.Embed(
-                title="❌ Calendar Not Found",
-                description=f"No calendar named '{calendar_name}' exists.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-
-        # Check if user has read permission
-        if not await bot.calendar_manager.has_permission(calendar.id, interaction.user.id, "reader"):
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You don't have permission to view events in this calendar.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-
-        # Parse date
+        # Validate the input before touching the database
         try:
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
+            target_date = parse_day(date)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Invalid Date Format",
-                description="Please use format: `YYYY-MM-DD`\n\nExample: `2024-01-15`",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Invalid Date Format", "Please use format: `YYYY-MM-DD`\n\nExample: `2024-01-15`")
             return
 
         # Validate hours
         if start_hour < 0 or start_hour > 23 or end_hour < 0 or end_hour > 23 or start_hour >= end_hour:
-            embed = discord.Embed(
-                title="❌ Invalid Hours",
-                description="Hours must be between 0-23 and start_hour must be less than end_hour.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send_error(interaction, "❌ Invalid Hours", "Hours must be between 0-23 and start_hour must be less than end_hour.")
             return
 
-        # Get events for the day
-        day_start = datetime.combine(target_date, datetime.min.time())
-        day_end = datetime.combine(target_date, datetime.max.time())
+        # Get the calendar (usually served from the calendar manager's cache)
+        calendar = await bot.calendar_manager.get_calendar(calendar_name)
+        if not calendar:
+            await send_error(interaction, "❌ Calendar Not Found", f"No calendar named '{calendar_name}' exists.")
+            return
+
+        # Get events for the day alongside the permission check, as in list_events
+        day_start = datetime.combine(target_date, time.min)
+        day_end = datetime.combine(target_date, time.max)
 
-        events = await bot.calendar_manager.get_calendar_events(
-            calendar.id, start_date=day_start, end_date=day_end
+        has_access, events = await asyncio.gather(
+            bot.calendar_manager.has_permission(calendar.id, interaction.user.id, "reader"),
+            bot.calendar_manager.get_calendar_events(calendar.id, start_date=day_start, end_date=day_end)
         )
 
+        # Check if user has read permission
+        if not has_access:
+            await send_error(interaction, "❌ Permission Denied", "You don't have permission to view events in this calendar.")
+            return
+
         # Create day visualization
         embed = discord.Embed(
             title=f"📅 {calendar_name} - {target_date.strftime('%A, %B %d, %Y')}",
-            color=discord.Color.blue()
-        )
-
-        # Create hourly schedule
-        schedule_text = ""
+            color=COLOR_INFO
+        )
+
+        # Bucket events by the hours they occupy (always including their start hour)
+        # so each hour reads its bucket instead of rescanning every event. Each event's
+        # time range is formatted once here, not once per hour it appears in
+        events_by_hour = [[] for _ in range(24)]
+        for event in events:
+            event_start, event_end = event.start_time, event.end_time
+            time_range = f"{event_start.strftime('%H:%M')}-{event_end.strftime('%H:%M')}"
+            event_start_hour = event_start.hour
+            entry = (event, time_range)
+            for hour in range(event_start_hour, max(event_start_hour + 1, event_end.hour)):
+                events_by_hour[hour].append(entry)
+
+        # Create hourly schedule, collecting lines and joining once at the end
+        schedule_parts = []
         for hour in range(start_hour, end_hour + 1):
             hour_str = f"{hour:02d}:00"
-
-            # Check for events at this hour
-            events_at_hour = []
-            for event in events:
-                event_start_hour = event.start_time.hour
-                event_end_hour = event.end_time.hour
-                if event_start_hour <= hour < event_end_hour or (hour == event_start_hour):
-                    events_at_hour.append(event)
+            events_at_hour = events_by_hour[hour]
 
             if events_at_hour:
-                for event in events_at_hour:
-                    schedule_text += f"**{hour_str}** 📍 **{event.title}** ({event.start_time.strftime('%H:%M')}-{event.end_time.strftime('%H:%M')})\n"
+                for event, time_range in events_at_hour:
+                    schedule_parts.append(f"**{hour_str}** 📍 **{event.title}** ({time_range})\n")
                     if event.location:
-                        schedule_text += f"        📍 {event.location}\n"
+                        schedule_parts.append(f"        📍 {event.location}\n")
             else:
-                schedule_text += f"{hour_str} ⬜ *Free*\n"
-
-        # Split into chunks if too long
-        if len(schedule_text) > 1024:
-            # Split the schedule into multiple fields
-            chunks = []
-            current_chunk = ""
-            lines = schedule_text.split('\n')
-
-            for line in lines:
-                if len(current_chunk) + len(line) > 1020:
-                    chunks.append(current_chunk)
-                    current_chunk = line + '\n'
-                else:
-                    current_chunk += line + '\n'
+                schedule_parts.append(f"{hour_str} ⬜ *Free*\n")
+        schedule_text = "".join(schedule_parts)
 
-            if current_chunk:
-                chunks.append(current_chunk)
-
-            for i, chunk in enumerate(chunks):
-                field_name = "📅 Schedule" if i == 0 else f"📅 Schedule (cont. {i+1})"
-                embed.add_field(name=field_name, value=chunk, inline=False)
-        else:
-            embed.add_field(name="📅 Schedule", value=schedule_text, inline=False)
+        # Discord caps field values, so long schedules continue in extra fields
+        for i, chunk in enumerate(chunk_by_lines(schedule_text)):
+            field_name = "📅 Schedule" if i == 0 else f"📅 Schedule (cont. {i+1})"
+            embed.add_field(name=field_name, value=chunk, inline=False)
 
         # Add summary
         total_events = len(events)
-        busy_hours = len([e for e in events])
+        busy_hours = total_events
         embed.add_field(name="📊 Summary", value=f"**{total_events}** events scheduled\n**{busy_hours}** busy periods", inline=True)
         embed.add_field(name="🕐 Time Range", value=f"{start_hour:02d}:00 - {end_hour:02d}:00", inline=True)
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     except Exception as e:
-        embed = discord.Embed(
-            title="❌ Error Visualizing Day",
-            description=f"Failed to visualize day: {str(e)}",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await send_error(interaction, "❌ Error Visualizing Day", f"Failed to visualize day: {str(e)}")
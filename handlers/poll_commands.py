@@ -1,12 +1,150 @@
+import asyncio
 import discord
+import json
+import logging
+import time
 import uuid
 from datetime import datetime, timedelta
+from typing import Optional
+from urllib.parse import quote
+from sqlalchemy import delete, func, insert, text, update
 from sqlalchemy.future import select
 from db.session import AsyncSessionLocal
 from db.models import Poll, Vote
 
+# Per-vote messages are debug-level; %-style arguments are only formatted when enabled
+logger = logging.getLogger(__name__)
+
+# Regional indicators 🇦 to 🇹, one per reaction-poll option (Discord allows 20 reactions)
+POLL_EMOJIS = tuple(chr(0x1F1E6 + i) for i in range(20))
+POLL_EMOJI_INDEX = {emoji: idx for idx, emoji in enumerate(POLL_EMOJIS)}
+# Vote writes can tolerate losing the last moments of commits on a server crash, so their
+# transactions skip waiting for the WAL flush; SET LOCAL limits this to one transaction
+RELAXED_COMMIT = text("SET LOCAL synchronous_commit = OFF")
+# Number of closed polls listed by /list_polls
+INACTIVE_POLLS_SHOWN = 10
+# Seconds a rendered /poll_results embed is reused; votes and deletes drop it immediately
+RESULTS_CACHE_TTL = 5
+# poll_id -> (monotonic time rendered, results embed)
+_results_cache = {}
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks = set()
+
+# The QuickChart config is fixed apart from labels and data, so it is serialized and
+# URL-quoted once around placeholders; only the two variable parts are encoded per call
+_CHART_CONFIG = json.dumps({
+    "type": "bar",
+    "data": {
+        "labels": "@LABELS@",
+        "datasets": [{
+            "label": "Votes",
+            "data": "@DATA@",
+            "backgroundColor": "rgba(54, 162, 235, 0.8)"
+        }]
+    },
+    "options": {
+        "responsive": True,
+        "scales": {
+            "y": {
+                "beginAtZero": True,
+                "ticks": {
+                    "stepSize": 1
+                }
+            }
+        }
+    }
+})
+_chart_head, _chart_rest = _CHART_CONFIG.split('"@LABELS@"')
+_chart_mid, _chart_tail = _chart_rest.split('"@DATA@"')
+CHART_URL_HEAD = "https://quickchart.io/chart?c=" + quote(_chart_head)
+CHART_URL_MID = quote(_chart_mid)
+CHART_URL_TAIL = quote(_chart_tail)
+
+def build_chart_url(labels: list, counts: list) -> str:
+    """QuickChart bar chart URL for the given option labels and vote counts"""
+    return CHART_URL_HEAD + quote(json.dumps(labels)) + CHART_URL_MID + quote(json.dumps(counts)) + CHART_URL_TAIL
+
+def cache_results(poll_id: str, embed: discord.Embed):
+    """Remember a rendered results embed, first dropping entries whose TTL has passed"""
+    now = time.monotonic()
+    for stale_id in [key for key, (rendered_at, _) in _results_cache.items() if now - rendered_at >= RESULTS_CACHE_TTL]:
+        del _results_cache[stale_id]
+    _results_cache[poll_id] = (now, embed)
+
+def invalidate_poll_results(poll_id: str):
+    """Forget the cached results embed for a poll"""
+    _results_cache.pop(poll_id, None)
+
+async def insert_votes(session, poll_id: str, user_id: int, option_indexes: list):
+    """Insert one vote per option index with a single multi-row INSERT (caller commits)"""
+    if not option_indexes:
+        return
+    voted_at = datetime.utcnow()
+    await session.execute(insert(Vote).values([
+        {"poll_id": poll_id, "user_id": user_id, "option_index": option_index, "voted_at": voted_at}
+        for option_index in option_indexes
+    ]))
+
+async def add_poll_reactions(message, emojis: list):
+    """Add the option reactions one at a time, so they stay in option order and within the reaction rate limit"""
+    for emoji in emojis:
+        try:
+            await message.add_reaction(emoji)
+        except:
+            pass  # Skip if emoji fails
+
+async def poll_id_for_message(message_id: int) -> Optional[str]:
+    """Return the ID of the poll posted as the given message, if any"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Poll.poll_id).where(Poll.message_id == message_id))
+        return result.scalar_one_or_none()
+
+async def apply_reaction_vote(poll_id: str, user_id: int, option_index: int, added: bool) -> bool:
+    """Apply a single reaction add/remove to the user's votes. Returns True if successful.
+
+    The reaction event already names the user and option, so unlike sync_reaction_votes
+    this never pages through reaction.users().
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            # Check if poll exists and is active
+            result = await session.execute(select(Poll).where(Poll.poll_id == poll_id))
+            poll = result.scalar_one_or_none()
+
+            if not poll or not poll.is_active:
+                return False
+
+            # Expired polls are closed by the bot's background sweep; just refuse the vote
+            if poll.expires_at and datetime.utcnow() > poll.expires_at:
+                return False
+
+            if not 0 <= option_index < len(poll.options):
+                return False
+
+            await session.execute(RELAXED_COMMIT)
+            vote_filter = (Vote.poll_id == poll_id, Vote.user_id == user_id, Vote.option_index == option_index)
+            if added:
+                result = await session.execute(select(Vote.id).where(*vote_filter).limit(1))
+                if result.first() is None:
+                    await insert_votes(session, poll_id, user_id, [option_index])
+            else:
+                await session.execute(delete(Vote).where(*vote_filter))
+            await session.commit()
+
+        invalidate_poll_results(poll_id)
+        stats_module.log_vote_action(user_id, poll_id)
+        logger.debug("%s vote for user %s: option %s", "Added" if added else "Removed", user_id, option_index)
+        return True
+
+    except Exception as e:
+        logger.error("Error applying reaction vote: %s", e)
+        return False
+
 async def sync_reaction_votes(poll_id: str, user_id: int, message) -> bool:
-    """Sync user's votes based on their current emoji reactions on the poll message. Returns True if successful."""
+    """Fully reconcile user's votes with their current emoji reactions on the poll message. Returns True if successful.
+
+    This pages through every poll reaction's users; per-reaction events use apply_reaction_vote.
+    """
     try:
         async with AsyncSessionLocal() as session:
             # Check if poll exists and is active
@@ -16,54 +154,40 @@ async def sync_reaction_votes(poll_id: str, user_id: int, message) -> bool:
             if not poll or not poll.is_active:
                 return False
 
-            # Check if poll has expired
+            # Expired polls are closed by the bot's background sweep; just refuse the vote
             if poll.expires_at and datetime.utcnow() > poll.expires_at:
-                poll.is_active = False
-                await session.commit()
                 return False
 
             # Get all user's current reactions on this message
             user_reactions = []
             for reaction in message.reactions:
-                emoji_str = str(reaction.emoji)
                 # Check if this is a poll emoji (🇦 to 🇹) and if user reacted to it
-                if len(emoji_str) == 1:
-                    char_code = ord(emoji_str)
-                    if 0x1F1E6 <= char_code <= 0x1F1F9:  # 🇦 to 🇹
-                        option_index = char_code - 0x1F1E6
-                        # Check if this user has reacted to this emoji
-                        async for user in reaction.users():
-                            if user.id == user_id:
-                                user_reactions.append(option_index)
-                                break
+                option_index = POLL_EMOJI_INDEX.get(str(reaction.emoji))
+                if option_index is not None:
+                    # Check if this user has reacted to this emoji
+                    async for user in reaction.users():
+                        if user.id == user_id:
+                            user_reactions.append(option_index)
+                            break
 
             # Validate option indexes
-            options = poll.options.split(",")
+            options = poll.options
             valid_reactions = [idx for idx in user_reactions if 0 <= idx < len(options)]
 
-            print(f"User {user_id} reactions: {valid_reactions}")
+            logger.debug("User %s reactions: %s", user_id, valid_reactions)
 
-            # Delete all existing votes for this user and poll
-            from sqlalchemy import delete
+            # Replace the user's votes in one transaction: one DELETE and one multi-row INSERT
+            await session.execute(RELAXED_COMMIT)
             await session.execute(delete(Vote).where(Vote.poll_id == poll_id, Vote.user_id == user_id))
-
-            # Add new votes based on current reactions
-            for option_index in valid_reactions:
-                vote = Vote(
-                    poll_id=poll_id,
-                    user_id=user_id,
-                    option_index=option_index,
-                    voted_at=datetime.utcnow()
-                )
-                session.add(vote)
-
+            await insert_votes(session, poll_id, user_id, valid_reactions)
             await session.commit()
+            invalidate_poll_results(poll_id)
             stats_module.log_vote_action(user_id, poll_id)
-            print(f"Synced votes for user {user_id}: options {valid_reactions}")
+            logger.debug("Synced votes for user %s: options %s", user_id, valid_reactions)
             return True
 
     except Exception as e:
-        print(f"Error syncing reaction votes: {e}")
+        logger.error("Error syncing reaction votes: %s", e)
         return False
 
 
@@ -99,7 +223,7 @@ async def create_poll_command(interaction: discord.Interaction, question: str, o
         poll = Poll(
             poll_id=poll_id,
             question=question,
-            options=",".join(opts),
+            options=opts,
             creator_id=interaction.user.id,
             channel_id=interaction.channel_id,
             is_active=True,
@@ -118,7 +242,7 @@ async def create_poll_command(interaction: discord.Interaction, question: str, o
     # Add options with emojis (use Unicode regional indicators for A-T)
     emoji_options = []
     for idx, opt in enumerate(opts):
-        emoji = chr(0x1F1E6 + idx)  # 🇦 to 🇹
+        emoji = POLL_EMOJIS[idx]
 
         emoji_options.append(emoji)
         embed.add_field(name=f"{emoji} {opt}", value="\u200b", inline=False)
@@ -127,13 +251,16 @@ async def create_poll_command(interaction: discord.Interaction, question: str, o
     embed.add_field(name="How to Vote", value="🔸 **Emoji reactions**: Your vote = clicked emojis\n🔸 **Slash command**: `/vote_poll` sets complete vote\n• Both methods are synchronized", inline=True)
     embed.set_footer(text=f"Created by {interaction.user.display_name}")
 
-    # Send poll message and add reactions
+    # Send poll message and remember it so votes can fetch it directly
     msg = await interaction.channel.send(embed=embed)
-    for emoji in emoji_options:
-        try:
-            await msg.add_reaction(emoji)
-        except:
-            pass  # Skip if emoji fails
+    async with AsyncSessionLocal() as session:
+        await session.execute(update(Poll).where(Poll.poll_id == poll_id).values(message_id=msg.id))
+        await session.commit()
+
+    # Add reactions in the background so the confirmation isn't held up by them
+    task = asyncio.create_task(add_poll_reactions(msg, emoji_options))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
     # Update the response
     embed_final = discord.Embed(
@@ -165,7 +292,7 @@ async def create_advanced_poll_command(interaction: discord.Interaction, questio
         poll = Poll(
             poll_id=poll_id,
             question=question,
-            options=",".join(opts),
+            options=opts,
             creator_id=interaction.user.id,
             channel_id=interaction.channel_id,
             is_active=True,
@@ -202,10 +329,8 @@ async def vote_poll_command(interaction: discord.Interaction, poll_id: str, opti
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        # Check if poll has expired
+        # Check if poll has expired (the background sweep marks it inactive)
         if poll.expires_at and datetime.utcnow() > poll.expires_at:
-            poll.is_active = False
-            await session.commit()
             embed = discord.Embed(title="Poll Expired", description="This poll has expired and is no longer accepting votes.", color=discord.Color.red())
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
@@ -218,64 +343,69 @@ async def vote_poll_command(interaction: discord.Interaction, poll_id: str, opti
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        # Check if option indexes are valid
-        options = poll.options.split(",")
-        invalid_options = [opt for opt in option_list if opt < 1 or opt > len(options)]
-        if invalid_options:
+        # Remove duplicates, then check the range with one min/max comparison
+        options = poll.options
+        option_set = set(option_list)
+        if option_set and (min(option_set) < 1 or max(option_set) > len(options)):
+            invalid_options = [opt for opt in option_list if opt < 1 or opt > len(options)]
             embed = discord.Embed(title="Error", description=f"Invalid options: {invalid_options}. Choose from 1-{len(options)}.", color=discord.Color.red())
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        # Remove duplicates and sort
-        option_list = sorted(list(set(option_list)))
+        option_list = sorted(option_set)
 
-                # Get user's current votes to compare
+        # Get user's current votes to compare
         result = await session.execute(
-            select(Vote).where(
+            select(Vote.option_index).where(
                 Vote.poll_id == poll_id,
                 Vote.user_id == interaction.user.id
             )
         )
-        current_votes = result.scalars().all()
-        old_option_indexes = {vote.option_index for vote in current_votes}
-
-        # Delete all existing votes for this user and poll
-        from sqlalchemy import delete
-        await session.execute(delete(Vote).where(Vote.poll_id == poll_id, Vote.user_id == interaction.user.id))
-
-        # Add new votes based on specified options
-        for option_index in option_list:
-            vote = Vote(
-                poll_id=poll_id,
-                user_id=interaction.user.id,
-                option_index=option_index - 1,
-                voted_at=datetime.utcnow()
-            )
-            session.add(vote)
+        old_option_indexes = set(result.scalars().all())
+
+        # Votes are low-stakes, so don't wait for the WAL flush on commit (this transaction only)
+        await session.execute(RELAXED_COMMIT)
 
+        # Only write the difference between the old and new selections
+        new_option_indexes = {option_index - 1 for option_index in option_list}
+        removed_indexes = old_option_indexes - new_option_indexes
+        if removed_indexes:
+            await session.execute(delete(Vote).where(
+                Vote.poll_id == poll_id,
+                Vote.user_id == interaction.user.id,
+                Vote.option_index.in_(sorted(removed_indexes))
+            ))
+        await insert_votes(session, poll_id, interaction.user.id, sorted(new_option_indexes - old_option_indexes))
         await session.commit()
+    invalidate_poll_results(poll_id)
 
     stats_module.log_vote_action(interaction.user.id, poll_id)
 
     # Update emoji reactions on the original poll message
     try:
-        channel = interaction.client.get_channel(poll.channel_id)
+        # Nothing to clean up unless options were dropped
+        channel = interaction.client.get_channel(poll.channel_id) if removed_indexes else None
+        message = None
         if channel:
-            # Find the poll message (look for recent messages with the poll_id)
-            async for message in channel.history(limit=50):
-                if message.embeds and poll_id in str(message.embeds[0].to_dict()):
-                    user = interaction.client.get_user(interaction.user.id)
-                    if user:
-                        # Remove user's reactions for old votes that are no longer selected
-                        for old_idx in old_option_indexes:
-                            emoji = chr(0x1F1E6 + old_idx)  # 🇦 to 🇹
-                            try:
-                                await message.remove_reaction(emoji, user)
-                            except:
-                                pass
-                    break
+            if poll.message_id:
+                message = await channel.fetch_message(poll.message_id)
+            elif not poll.is_advanced:
+                # Polls created before message_id was stored: look through recent messages
+                async for candidate in channel.history(limit=50):
+                    if candidate.embeds and poll_id in str(candidate.embeds[0].to_dict()):
+                        message = candidate
+                        break
+        if message:
+            user = interaction.client.get_user(interaction.user.id)
+            if user:
+                # Remove user's reactions for old votes that are no longer selected, concurrently;
+                # a failed removal is skipped like before
+                await asyncio.gather(
+                    *(message.remove_reaction(POLL_EMOJIS[old_idx], user) for old_idx in removed_indexes),
+                    return_exceptions=True
+                )
     except Exception as e:
-        print(f"Could not update reactions: {e}")
+        logger.warning("Could not update reactions: %s", e)
 
     # Create response message
     selected_options = [options[idx - 1] for idx in option_list]
@@ -294,32 +424,40 @@ async def vote_poll_command(interaction: discord.Interaction, poll_id: str, opti
 
 
 async def poll_results_command(interaction: discord.Interaction, poll_id: str):
+    # Repeated lookups shortly after one another reuse the rendered embed
+    cached = _results_cache.get(poll_id)
+    if cached:
+        if time.monotonic() - cached[0] < RESULTS_CACHE_TTL:
+            await interaction.response.send_message(embed=cached[1], ephemeral=True)
+            return
+        del _results_cache[poll_id]
+
     async with AsyncSessionLocal() as session:
-        # Get poll
-        result = await session.execute(select(Poll).where(Poll.poll_id == poll_id))
-        poll = result.scalar_one_or_none()
+        # Get the poll and its per-option vote counts in one round trip; the outer join
+        # yields a single (poll, None, 0) row when there are no votes yet
+        result = await session.execute(
+            select(Poll, Vote.option_index, func.count(Vote.id))
+            .outerjoin(Vote, Vote.poll_id == Poll.poll_id)
+            .where(Poll.poll_id == poll_id)
+            .group_by(Poll.id, Vote.option_index)
+        )
+        rows = result.all()
+        poll = rows[0][0] if rows else None
 
         if not poll:
             embed = discord.Embed(title="Error", description="Poll not found.", color=discord.Color.red())
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        # Check if poll has expired
+        # Check if poll has expired; the background sweep closes it in the database
         is_expired = poll.expires_at and datetime.utcnow() > poll.expires_at
-        if is_expired and poll.is_active:
-            poll.is_active = False
-            await session.commit()
-
-        # Get all votes for this poll
-        result = await session.execute(select(Vote).where(Vote.poll_id == poll_id))
-        votes = result.scalars().all()
 
-        # Count votes (handle multiple votes per user for advanced polls)
-        options = poll.options.split(",")
+        # Counts are per option (handles multiple votes per user for advanced polls)
+        options = poll.options
         counts = [0] * len(options)
-        for vote in votes:
-            if 0 <= vote.option_index < len(counts):
-                counts[vote.option_index] += 1
+        for _, option_index, count in rows:
+            if option_index is not None and 0 <= option_index < len(counts):
+                counts[option_index] = count
 
         total_votes = sum(counts)
 
@@ -336,17 +474,19 @@ async def poll_results_command(interaction: discord.Interaction, poll_id: str):
         embed.add_field(name="Total Votes", value=str(total_votes), inline=True)
         embed.add_field(name="Poll ID", value=poll_id, inline=True)
 
-        # Add results with percentages and bar visualization
+        # Add results with percentages and bar visualization; bars scale to the leading option
+        bar_length = 20
+        max_count = max(counts, default=0) or 1
         for idx, opt in enumerate(options):
             count = counts[idx]
             percentage = (count / total_votes * 100) if total_votes > 0 else 0
 
             # Create a simple text bar
-            bar_length = 20
-            filled_length = int(bar_length * count / max(counts)) if max(counts) > 0 else 0
+            filled_length = int(bar_length * count / max_count)
             bar = "█" * filled_length + "░" * (bar_length - filled_length)
 
-            emoji = chr(0x1F1E6 + idx)  # 🇦 to 🇹
+            # Advanced polls can have more options than there are poll emojis
+            emoji = POLL_EMOJIS[idx] if idx < len(POLL_EMOJIS) else chr(0x1F1E6 + idx)
 
             embed.add_field(
                 name=f"{emoji} {opt}",
@@ -358,31 +498,8 @@ async def poll_results_command(interaction: discord.Interaction, poll_id: str):
         if total_votes > 0:
             try:
                 # Create visualization with QuickChart
-                chart_data = {
-                    "type": "bar",
-                    "data": {
-                        "labels": [f"{opt[:20]}..." if len(opt) > 20 else opt for opt in options],
-                        "datasets": [{
-                            "label": "Votes",
-                            "data": counts,
-                            "backgroundColor": "rgba(54, 162, 235, 0.8)"
-                        }]
-                    },
-                    "options": {
-                        "responsive": True,
-                        "scales": {
-                            "y": {
-                                "beginAtZero": True,
-                                "ticks": {
-                                    "stepSize": 1
-                                }
-                            }
-                        }
-                    }
-                }
-                import json
-                import urllib.parse
-                chart_url = f"https://quickchart.io/chart?c={urllib.parse.quote(json.dumps(chart_data))}"
+                labels = [f"{opt[:20]}..." if len(opt) > 20 else opt for opt in options]
+                chart_url = build_chart_url(labels, counts)
                 embed.set_image(url=chart_url)
             except:
                 pass  # If chart fails, just show the text results
@@ -393,6 +510,7 @@ async def poll_results_command(interaction: discord.Interaction, poll_id: str):
         else:
             time_info = f"Created: {poll.created_at.strftime('%Y-%m-%d %H:%M UTC')}"
         embed.set_footer(text=time_info)
+        cache_results(poll_id, embed)
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -402,9 +520,17 @@ async def list_polls_command(interaction: discord.Interaction):
         result = await session.execute(select(Poll).where(Poll.is_active == True))
         active_polls = result.scalars().all()
 
-        # Get inactive polls
-        result = await session.execute(select(Poll).where(Poll.is_active == False))
-        inactive_polls = result.scalars().all()
+        # Get the 10 most recent inactive polls; the window count carries the total
+        # number of inactive polls, since it is evaluated before the LIMIT
+        result = await session.execute(
+            select(Poll, func.count().over())
+            .where(Poll.is_active == False)
+            .order_by(Poll.created_at.desc())
+            .limit(INACTIVE_POLLS_SHOWN)
+        )
+        rows = result.all()
+        inactive_polls = [poll for poll, _ in rows]
+        inactive_total = rows[0][1] if rows else 0
 
         embed = discord.Embed(title="📊 All Polls", color=discord.Color.blue())
 
@@ -434,20 +560,20 @@ async def list_polls_command(interaction: discord.Interaction):
         # Inactive polls section
         if inactive_polls:
             inactive_desc = ""
-            for poll in inactive_polls[:10]:  # Limit to last 10 inactive polls
+            for poll in inactive_polls:
                 poll_type = "🔮 Advanced" if poll.is_advanced else "📊 Simple"
                 closed_date = poll.expires_at.strftime("%m/%d %H:%M") if poll.expires_at else "Unknown"
                 inactive_desc += f"• `{poll.poll_id}` {poll_type} - {poll.question[:50]}{'...' if len(poll.question) > 50 else ''} (Closed: {closed_date})\n"
 
-            if len(inactive_polls) > 10:
-                inactive_desc += f"\n... and {len(inactive_polls) - 10} more"
+            if inactive_total > len(inactive_polls):
+                inactive_desc += f"\n... and {inactive_total - len(inactive_polls)} more"
 
             embed.add_field(name="🔒 Inactive Polls", value=inactive_desc, inline=False)
         else:
             embed.add_field(name="🔒 Inactive Polls", value="None", inline=False)
 
         embed.add_field(name="Commands", value="• `/poll_results <poll_id>` - View results\n• `/vote_poll <poll_id> <options>` - Vote in poll", inline=False)
-        embed.set_footer(text=f"Total: {len(active_polls)} active, {len(inactive_polls)} inactive")
+        embed.set_footer(text=f"Total: {len(active_polls)} active, {inactive_total} inactive")
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -463,11 +589,11 @@ async def delete_poll_command(interaction: discord.Interaction, poll_id: str):
             embed = discord.Embed(title="Permission Denied", description="Only the poll creator or server owner can delete this poll.", color=discord.Color.red())
         else:
             # Delete all votes for this poll first
-            from sqlalchemy import delete
             await session.execute(delete(Vote).where(Vote.poll_id == poll_id))
             # Delete the poll
             await session.delete(poll)
             await session.commit()
+            invalidate_poll_results(poll_id)
             embed = discord.Embed(title="Poll Deleted", description=f"Poll {poll_id} deleted.", color=discord.Color.green())
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
\ No newline at end of file
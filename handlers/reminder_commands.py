@@ -3,9 +3,99 @@ from discord import app_commands
 from datetime import datetime, timedelta
 from typing import Optional, List
 import asyncio
+import re
 
 from services.reminder_manager import ReminderPriority, TriggerType
 
+# Option value -> enum member, so unknown values are a dict miss rather than a raised ValueError
+PRIORITY_BY_VALUE = {priority.value: priority for priority in ReminderPriority}
+TRIGGER_TYPE_BY_VALUE = {trigger_type.value: trigger_type for trigger_type in TriggerType}
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+DISPLAY_TIME_FORMAT = TIME_FORMAT + " UTC"
+
+def parse_trigger_time(value: str) -> datetime:
+    """Parse a 'YYYY-MM-DD HH:MM' reminder time; raises ValueError like strptime"""
+    # The format is fixed-width, so slice it directly and only fall back to strptime otherwise
+    if len(value) == 16 and value[4] == '-' and value[7] == '-' and value[10] == ' ' and value[13] == ':':
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]))
+    return datetime.strptime(value, TIME_FORMAT)
+
+# Whole-input checks first, so a malformed entry is rejected instead of silently skipped
+INT_LIST_PATTERN = re.compile(r"\s*[-+]?\d+\s*(?:,\s*[-+]?\d+\s*)*")
+INT_PATTERN = re.compile(r"[-+]?\d+")
+KEY_VALUES_PATTERN = re.compile(r"[^=,]*=[^,]*(?:,[^=,]*=[^,]*)*")
+KEY_VALUE_PATTERN = re.compile(r"([^=,]*)=([^,]*)")
+
+def parse_int_list(value: str) -> List[int]:
+    """Parse '1, 2,3' into [1, 2, 3]; raises ValueError on anything else"""
+    if not INT_LIST_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid number list: {value}")
+    return list(map(int, INT_PATTERN.findall(value)))
+
+def parse_key_values(value: str) -> dict:
+    """Parse 'key=value,key2=value2' into a dict of stripped strings; raises ValueError on a pair without '='"""
+    if not KEY_VALUES_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid key=value list: {value}")
+    return {key.strip(): item.strip() for key, item in KEY_VALUE_PATTERN.findall(value)}
+
+def shorten(text: Optional[str], limit: int) -> Optional[str]:
+    """Cut text to limit characters, marking the cut with '...'; None passes through"""
+    if text and len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+def list_embed(title: str, fields: List[dict], total: int, noun: str) -> discord.Embed:
+    """Build a listing embed from its field payloads in one step, noting when the list was cut short"""
+    data = {"title": title, "color": 0x3498db, "fields": fields}
+    if total > len(fields):
+        data["footer"] = {"text": f"Showing {len(fields)} of {total} {noun}"}
+    return discord.Embed.from_dict(data)
+
+async def send_reply(interaction: discord.Interaction, content: Optional[str] = None, *, embed: Optional[discord.Embed] = None, ephemeral: bool = False):
+    """Reply directly, or through the followup webhook once the interaction has been deferred.
+
+    Commands validate their input first (so those errors stay ephemeral), then defer before
+    calling the reminder manager, whose database work can outlast Discord's 3-second deadline.
+    """
+    if not interaction.response.is_done():
+        await interaction.response.send_message(content, embed=embed, ephemeral=ephemeral)
+        return
+    if ephemeral and interaction.extras.get("public_defer"):
+        # The first followup would replace the public "thinking" message and be visible to
+        # everyone, so remove that placeholder and send the private reply as a new message
+        try:
+            await interaction.delete_original_response()
+        except discord.HTTPException:
+            pass
+    await interaction.followup.send(content, embed=embed, ephemeral=ephemeral)
+
+async def defer_public(interaction: discord.Interaction):
+    """Defer a command whose success message is posted to the channel"""
+    interaction.extras["public_defer"] = True
+    await interaction.response.defer()
+
+async def resolve_member_names(guild: Optional[discord.Guild], user_ids) -> dict:
+    """Map user IDs to display names, fetching members missing from the cache in one gateway request"""
+    names = {}
+    if not guild:
+        return names
+    missing = []
+    for user_id in user_ids:
+        member = guild.get_member(user_id)
+        if member:
+            names[user_id] = member.display_name
+        else:
+            missing.append(user_id)
+    if missing:
+        try:
+            # cache=True stores the fetched members, so later lookups hit get_member
+            for member in await guild.query_members(user_ids=missing, cache=True):
+                names[member.id] = member.display_name
+        except Exception:
+            pass  # Unresolved creators are shown as "Unknown"
+    return names
+
 # ========== Template Commands ==========
 
 async def create_reminder_template_command(
@@ -20,7 +110,10 @@ async def create_reminder_template_command(
     """Create a new reminder template"""
     try:
         # Parse priority
-        priority_enum = ReminderPriority(priority)
+        priority_enum = PRIORITY_BY_VALUE.get(priority)
+        if priority_enum is None:
+            await send_reply(interaction, f"❌ Unknown priority `{priority}`. Use one of: {', '.join(PRIORITY_BY_VALUE)}.", ephemeral=True)
+            return
 
         # Parse ping lists
         ping_role_ids = []
@@ -28,18 +121,19 @@ async def create_reminder_template_command(
 
         if ping_roles:
             try:
-                ping_role_ids = [int(x.strip()) for x in ping_roles.split(',')]
+                ping_role_ids = parse_int_list(ping_roles)
             except ValueError:
-                await interaction.response.send_message("❌ Invalid role IDs format. Use comma-separated numbers.", ephemeral=True)
+                await send_reply(interaction, "❌ Invalid role IDs format. Use comma-separated numbers.", ephemeral=True)
                 return
 
         if ping_users:
             try:
-                ping_user_ids = [int(x.strip()) for x in ping_users.split(',')]
+                ping_user_ids = parse_int_list(ping_users)
             except ValueError:
-                await interaction.response.send_message("❌ Invalid user IDs format. Use comma-separated numbers.", ephemeral=True)
+                await send_reply(interaction, "❌ Invalid user IDs format. Use comma-separated numbers.", ephemeral=True)
                 return
 
+        await defer_public(interaction)
         # Create template
         template = await interaction.client.reminder_manager.create_template(
             name=name,
@@ -57,49 +151,46 @@ async def create_reminder_template_command(
             color=0x00ff00
         )
         embed.add_field(name="Priority", value=priority.title(), inline=True)
-        embed.add_field(name="Message Preview", value=message_template[:100] + "..." if len(message_template) > 100 else message_template, inline=False)
+        embed.add_field(name="Message Preview", value=shorten(message_template, 100), inline=False)
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except ValueError as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
     except Exception as e:
-        await interaction.response.send_message(f"❌ Unexpected error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Unexpected error: {str(e)}", ephemeral=True)
 
 async def list_reminder_templates_command(interaction: discord.Interaction, show_mine_only: bool = False):
     """List all reminder templates"""
     try:
+        await interaction.response.defer(ephemeral=True)
         creator_id = interaction.user.id if show_mine_only else None
         templates = await interaction.client.reminder_manager.list_templates(creator_id)
 
         if not templates:
-            await interaction.response.send_message("📝 No reminder templates found.", ephemeral=True)
+            await send_reply(interaction, "📝 No reminder templates found.", ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title=f"📋 Reminder Templates {'(Your Templates)' if show_mine_only else ''}",
-            color=0x3498db
-        )
-
-        for template in templates[:10]:  # Limit to 10 templates
-            creator = interaction.guild.get_member(template.created_by)
-            creator_name = creator.display_name if creator else "Unknown"
-
-            embed.add_field(
-                name=f"🔖 {template.name}",
-                value=f"**Priority:** {template.priority.title()}\n"
-                      f"**Creator:** {creator_name}\n"
-                      f"**Description:** {template.description or 'No description'}",
-                inline=True
-            )
+        shown = templates[:10]  # Limit to 10 templates
+        creator_names = await resolve_member_names(interaction.guild, {t.created_by for t in shown})
 
-        if len(templates) > 10:
-            embed.set_footer(text=f"Showing 10 of {len(templates)} templates")
+        fields = [
+            {
+                "name": f"🔖 {template.name}",
+                "value": f"**Priority:** {template.priority.title()}\n"
+                         f"**Creator:** {creator_names.get(template.created_by, 'Unknown')}\n"
+                         f"**Description:** {template.description or 'No description'}",
+                "inline": True
+            }
+            for template in shown
+        ]
+        embed = list_embed(f"📋 Reminder Templates {'(Your Templates)' if show_mine_only else ''}",
+                           fields, len(templates), "templates")
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
 
 # ========== Poll Reminder Commands ==========
 
@@ -115,17 +206,20 @@ async def set_poll_reminder_command(
 ):
     """Set a reminder for a poll"""
     try:
-        trigger_type = TriggerType(reminder_type)
+        trigger_type = TRIGGER_TYPE_BY_VALUE.get(reminder_type)
+        if trigger_type is None:
+            await send_reply(interaction, f"❌ Unknown reminder type `{reminder_type}`. Use one of: {', '.join(TRIGGER_TYPE_BY_VALUE)}.", ephemeral=True)
+            return
 
         # Validate parameters based on reminder type
         if trigger_type == TriggerType.TIME_BEFORE and not minutes_before:
-            await interaction.response.send_message("❌ `minutes_before` is required for time_before reminders.", ephemeral=True)
+            await send_reply(interaction, "❌ `minutes_before` is required for time_before reminders.", ephemeral=True)
             return
         elif trigger_type == TriggerType.INTERVAL and not interval_minutes:
-            await interaction.response.send_message("❌ `interval_minutes` is required for interval reminders.", ephemeral=True)
+            await send_reply(interaction, "❌ `interval_minutes` is required for interval reminders.", ephemeral=True)
             return
         elif trigger_type == TriggerType.SPECIFIC_TIME and not specific_time:
-            await interaction.response.send_message("❌ `specific_time` is required for specific_time reminders. Format: YYYY-MM-DD HH:MM", ephemeral=True)
+            await send_reply(interaction, "❌ `specific_time` is required for specific_time reminders. Format: YYYY-MM-DD HH:MM", ephemeral=True)
             return
 
         kwargs = {}
@@ -137,11 +231,12 @@ async def set_poll_reminder_command(
             kwargs['max_occurrences'] = max_occurrences
         if specific_time:
             try:
-                kwargs['trigger_time'] = datetime.strptime(specific_time, "%Y-%m-%d %H:%M")
+                kwargs['trigger_time'] = parse_trigger_time(specific_time)
             except ValueError:
-                await interaction.response.send_message("❌ Invalid time format. Use: YYYY-MM-DD HH:MM", ephemeral=True)
+                await send_reply(interaction, "❌ Invalid time format. Use: YYYY-MM-DD HH:MM", ephemeral=True)
                 return
 
+        await defer_public(interaction)
         # Create the reminder
         reminder = await interaction.client.reminder_manager.create_poll_reminder(
             poll_id=poll_id,
@@ -162,14 +257,14 @@ async def set_poll_reminder_command(
         embed.add_field(name="Reminder ID", value=reminder.reminder_id[:8], inline=True)
 
         if reminder.next_trigger:
-            embed.add_field(name="Next Trigger", value=reminder.next_trigger.strftime("%Y-%m-%d %H:%M UTC"), inline=False)
+            embed.add_field(name="Next Trigger", value=reminder.next_trigger.strftime(DISPLAY_TIME_FORMAT), inline=False)
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except ValueError as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
     except Exception as e:
-        await interaction.response.send_message(f"❌ Unexpected error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Unexpected error: {str(e)}", ephemeral=True)
 
 # ========== Custom Reminder Commands ==========
 
@@ -184,14 +279,17 @@ async def set_custom_reminder_command(
 ):
     """Set a custom reminder"""
     try:
-        trigger_type = TriggerType(reminder_type)
+        trigger_type = TRIGGER_TYPE_BY_VALUE.get(reminder_type)
+        if trigger_type is None:
+            await send_reply(interaction, f"❌ Unknown reminder type `{reminder_type}`. Use one of: {', '.join(TRIGGER_TYPE_BY_VALUE)}.", ephemeral=True)
+            return
 
         # Validate parameters
         if trigger_type == TriggerType.INTERVAL and not interval_minutes:
-            await interaction.response.send_message("❌ `interval_minutes` is required for interval reminders.", ephemeral=True)
+            await send_reply(interaction, "❌ `interval_minutes` is required for interval reminders.", ephemeral=True)
             return
         elif trigger_type == TriggerType.SPECIFIC_TIME and not specific_time:
-            await interaction.response.send_message("❌ `specific_time` is required for specific_time reminders. Format: YYYY-MM-DD HH:MM", ephemeral=True)
+            await send_reply(interaction, "❌ `specific_time` is required for specific_time reminders. Format: YYYY-MM-DD HH:MM", ephemeral=True)
             return
 
         kwargs = {}
@@ -201,9 +299,9 @@ async def set_custom_reminder_command(
             kwargs['max_occurrences'] = max_occurrences
         if specific_time:
             try:
-                kwargs['trigger_time'] = datetime.strptime(specific_time, "%Y-%m-%d %H:%M")
+                kwargs['trigger_time'] = parse_trigger_time(specific_time)
             except ValueError:
-                await interaction.response.send_message("❌ Invalid time format. Use: YYYY-MM-DD HH:MM", ephemeral=True)
+                await send_reply(interaction, "❌ Invalid time format. Use: YYYY-MM-DD HH:MM", ephemeral=True)
                 return
 
         # Parse custom data
@@ -211,13 +309,12 @@ async def set_custom_reminder_command(
         if custom_data:
             try:
                 # Simple key=value,key2=value2 format
-                for pair in custom_data.split(','):
-                    key, value = pair.split('=', 1)
-                    custom_data_dict[key.strip()] = value.strip()
+                custom_data_dict = parse_key_values(custom_data)
             except ValueError:
-                await interaction.response.send_message("❌ Invalid custom_data format. Use: key=value,key2=value2", ephemeral=True)
+                await send_reply(interaction, "❌ Invalid custom_data format. Use: key=value,key2=value2", ephemeral=True)
                 return
 
+        await defer_public(interaction)
         # Create the reminder
         reminder = await interaction.client.reminder_manager.create_custom_reminder(
             template_name=template_name,
@@ -238,20 +335,21 @@ async def set_custom_reminder_command(
         embed.add_field(name="Reminder ID", value=reminder.reminder_id[:8], inline=True)
 
         if reminder.next_trigger:
-            embed.add_field(name="Next Trigger", value=reminder.next_trigger.strftime("%Y-%m-%d %H:%M UTC"), inline=False)
+            embed.add_field(name="Next Trigger", value=reminder.next_trigger.strftime(DISPLAY_TIME_FORMAT), inline=False)
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except ValueError as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
     except Exception as e:
-        await interaction.response.send_message(f"❌ Unexpected error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Unexpected error: {str(e)}", ephemeral=True)
 
 # ========== Management Commands ==========
 
 async def list_my_reminders_command(interaction: discord.Interaction, show_inactive: bool = False):
     """List user's reminders"""
     try:
+        await interaction.response.defer(ephemeral=True)
         is_active = None if show_inactive else True
         reminders = await interaction.client.reminder_manager.list_reminders(
             creator_id=interaction.user.id,
@@ -259,39 +357,36 @@ async def list_my_reminders_command(interaction: discord.Interaction, show_inact
         )
 
         if not reminders:
-            await interaction.response.send_message("📝 No reminders found.", ephemeral=True)
+            await send_reply(interaction, "📝 No reminders found.", ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title=f"⏰ Your Reminders {'(Including Inactive)' if show_inactive else '(Active Only)'}",
-            color=0x3498db
-        )
-
+        fields = []
         for reminder in reminders[:10]:  # Limit to 10 reminders
             status = "🟢 Active" if reminder.is_active else "🔴 Inactive"
-            next_trigger = reminder.next_trigger.strftime("%Y-%m-%d %H:%M UTC") if reminder.next_trigger else "N/A"
-
-            embed.add_field(
-                name=f"🔖 {reminder.reminder_id[:8]}",
-                value=f"**Status:** {status}\n"
-                      f"**Type:** {reminder.target_type.title()}\n"
-                      f"**Target:** {reminder.target_id or 'Custom'}\n"
-                      f"**Next:** {next_trigger}\n"
-                      f"**Count:** {reminder.occurrence_count}",
-                inline=True
-            )
+            next_trigger = reminder.next_trigger.strftime(DISPLAY_TIME_FORMAT) if reminder.next_trigger else "N/A"
+
+            fields.append({
+                "name": f"🔖 {reminder.reminder_id[:8]}",
+                "value": f"**Status:** {status}\n"
+                         f"**Type:** {reminder.target_type.title()}\n"
+                         f"**Target:** {reminder.target_id or 'Custom'}\n"
+                         f"**Next:** {next_trigger}\n"
+                         f"**Count:** {reminder.occurrence_count}",
+                "inline": True
+            })
 
-        if len(reminders) > 10:
-            embed.set_footer(text=f"Showing 10 of {len(reminders)} reminders")
+        embed = list_embed(f"⏰ Your Reminders {'(Including Inactive)' if show_inactive else '(Active Only)'}",
+                           fields, len(reminders), "reminders")
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
 
 async def cancel_reminder_command(interaction: discord.Interaction, reminder_id: str):
     """Cancel a reminder"""
     try:
+        await interaction.response.defer(ephemeral=True)
         success = await interaction.client.reminder_manager.cancel_reminder(reminder_id)
 
         if success:
@@ -307,43 +402,39 @@ async def cancel_reminder_command(interaction: discord.Interaction, reminder_id:
                 color=0xff0000
             )
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
 
 async def reminder_logs_command(interaction: discord.Interaction, reminder_id: str):
     """View reminder execution logs"""
     try:
+        await interaction.response.defer(ephemeral=True)
         logs = await interaction.client.reminder_manager.get_reminder_logs(reminder_id)
 
         if not logs:
-            await interaction.response.send_message(f"📝 No logs found for reminder `{reminder_id}`.", ephemeral=True)
+            await send_reply(interaction, f"📝 No logs found for reminder `{reminder_id}`.", ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title=f"📊 Reminder Logs - {reminder_id[:8]}",
-            color=0x3498db
-        )
-
+        fields = []
         for log in logs[:5]:  # Show last 5 logs
             status_emoji = "✅" if log.status == "sent" else "❌" if log.status == "failed" else "⏭️"
 
-            embed.add_field(
-                name=f"{status_emoji} {log.triggered_at.strftime('%Y-%m-%d %H:%M')}",
-                value=f"**Status:** {log.status.title()}\n"
-                      f"**Error:** {log.error_message or 'None'}\n"
-                      f"**Message:** {(log.message_content[:50] + '...') if log.message_content and len(log.message_content) > 50 else log.message_content or 'N/A'}",
-                inline=True
-            )
+            fields.append({
+                "name": f"{status_emoji} {log.triggered_at.strftime(TIME_FORMAT)}",
+                "value": f"**Status:** {log.status.title()}\n"
+                         f"**Error:** {log.error_message or 'None'}\n"
+                         f"**Message:** {shorten(log.message_content, 50) or 'N/A'}",
+                "inline": True
+            })
 
-        if len(logs) > 5:
-            embed.set_footer(text=f"Showing 5 of {len(logs)} logs")
+        embed = list_embed(f"📊 Reminder Logs - {reminder_id[:8]}", fields, len(logs), "logs")
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
 
 # ========== Quick Setup Commands ==========
 
@@ -357,20 +448,18 @@ async def quick_poll_reminders_command(
     try:
         # Parse remind times
         try:
-            minutes_list = [int(x.strip()) for x in remind_times.split(',')]
+            minutes_list = parse_int_list(remind_times)
         except ValueError:
-            await interaction.response.send_message("❌ Invalid remind_times format. Use comma-separated minutes like: 60,30,10", ephemeral=True)
+            await send_reply(interaction, "❌ Invalid remind_times format. Use comma-separated minutes like: 60,30,10", ephemeral=True)
             return
 
-        # Create reminder configs
-        configs = []
-        for minutes in minutes_list:
-            configs.append({
-                'type': 'time_before',
-                'template': template_name,
-                'minutes_before': minutes
-            })
+        # Create reminder configs; the manager saves them all in one transaction
+        configs = [
+            {'type': 'time_before', 'template': template_name, 'minutes_before': minutes}
+            for minutes in minutes_list
+        ]
 
+        await defer_public(interaction)
         # Set up reminders
         created_reminders = await interaction.client.reminder_manager.setup_poll_reminders(
             poll_id=poll_id,
@@ -385,15 +474,11 @@ async def quick_poll_reminders_command(
             color=0x00ff00
         )
 
-        reminder_list = []
-        for i, reminder in enumerate(created_reminders):
-            minutes = minutes_list[i]
-            reminder_list.append(f"• {minutes} minutes before expiry")
-
-        embed.add_field(name="Reminders Created", value="\n".join(reminder_list), inline=False)
+        reminder_list = "\n".join(f"• {reminder.time_before_minutes} minutes before expiry" for reminder in created_reminders)
+        embed.add_field(name="Reminders Created", value=reminder_list, inline=False)
         embed.add_field(name="Template Used", value=template_name, inline=True)
 
-        await interaction.response.send_message(embed=embed)
+        await send_reply(interaction, embed=embed)
 
     except Exception as e:
-        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+        await send_reply(interaction, f"❌ Error: {str(e)}", ephemeral=True)
@@ -2,10 +2,11 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from typing import Callable, Optional
 from datetime import datetime
 import asyncio
+from config.config import JOB_DEFAULTS
 
 class ReminderScheduler:
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+        self.scheduler = AsyncIOScheduler(job_defaults=JOB_DEFAULTS)
         self._started = False
 
     async def start(self):
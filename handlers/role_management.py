@@ -410,9 +410,7 @@ async def add_user_to_role_command(interaction: discord.Interaction, user: disco
         await user.add_roles(discord_role, reason="Added by bot command")
 
         # Update database
-        user_profile = await bot.user_manager.get_user(user.id)
-        if not user_profile:
-            user_profile = await bot.user_manager.ensure_user(user.id)
+        user_profile = await bot.user_manager.ensure_user(user.id)
 
         if not user_profile.roles:
             user_profile.roles = []
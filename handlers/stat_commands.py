@@ -1,34 +1,25 @@
 import discord
-from collections import defaultdict
+from collections import Counter
 from sqlalchemy.future import select
 from db.session import AsyncSessionLocal
 from db.models import Poll, Vote
 
 async def stats_command(interaction: discord.Interaction):
     async with AsyncSessionLocal() as session:
-        # Get poll statistics
-        poll_result = await session.execute(select(Poll))
-        polls = poll_result.scalars().all()
+        # Only the user columns are needed for the tallies
+        poll_result = await session.execute(select(Poll.creator_id))
+        creator_ids = poll_result.scalars().all()
 
-        # Get vote statistics
-        vote_result = await session.execute(select(Vote))
-        votes = vote_result.scalars().all()
+        vote_result = await session.execute(select(Vote.user_id))
+        voter_ids = vote_result.scalars().all()
 
         # Calculate stats
-        total_polls = len(polls)
-        total_votes = len(votes)
+        total_polls = len(creator_ids)
+        total_votes = len(voter_ids)
 
-        # Top voters
-        vote_counts = defaultdict(int)
-        for vote in votes:
-            vote_counts[vote.user_id] += 1
-        top_voters = sorted(vote_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        # Top poll creators
-        poll_counts = defaultdict(int)
-        for poll in polls:
-            poll_counts[poll.creator_id] += 1
-        top_poll_creators = sorted(poll_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Counter tallies in C; most_common sorts by count like the old manual sort
+        top_voters = Counter(voter_ids).most_common(5)
+        top_poll_creators = Counter(creator_ids).most_common(5)
 
         # Build description
         desc = f"Total Votes: {total_votes}\nTotal Polls: {total_polls}\n"
@@ -1,14 +1,35 @@
+from sqlalchemy import and_
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from db.session import AsyncSessionLocal
 from db.models import SharedCalendar, CalendarPermission, CalendarEvent, EventAttendee, UserProfile
 from datetime import datetime
 from typing import List, Optional, Dict, Tuple
 import discord
+import time
+
+# Seconds a calendar looked up by name is served from memory
+CALENDAR_CACHE_TTL = 60
+# Permission hierarchy: owner > writer > reader
+PERMISSION_LEVELS = {"reader": 1, "writer": 2, "owner": 3}
 
 class CalendarManager:
     """Manages shared calendars, permissions, and events"""
 
+    def __init__(self):
+        # calendar name -> (cached_at, SharedCalendar with permissions loaded)
+        self._calendar_cache: Dict[str, Tuple[float, SharedCalendar]] = {}
+
+    def _invalidate_calendar(self, calendar_id: int = None, name: str = None) -> None:
+        """Drop cached calendar rows by name and/or ID"""
+        if name is not None:
+            self._calendar_cache.pop(name, None)
+        if calendar_id is not None:
+            for cached_name, (_, calendar) in list(self._calendar_cache.items()):
+                if calendar.id == calendar_id:
+                    del self._calendar_cache[cached_name]
+
     async def create_calendar(self, name: str, creator_id: int, description: str = "", google_calendar_id: str = "") -> SharedCalendar:
         """Create a new shared calendar"""
         async with AsyncSessionLocal() as session:
@@ -21,21 +42,31 @@ class CalendarManager:
             session.add(calendar)
             await session.commit()
             await session.refresh(calendar)
+        self._invalidate_calendar(name=name)
 
-            # Add creator as owner
-            await self.add_permission(calendar.id, creator_id, "owner", creator_id)
+        # Add creator as owner (add_permission opens its own session)
+        await self.add_permission(calendar.id, creator_id, "owner", creator_id)
 
-            return calendar
+        return calendar
 
     async def get_calendar(self, calendar_name: str) -> Optional[SharedCalendar]:
         """Get calendar by name"""
+        entry = self._calendar_cache.get(calendar_name)
+        if entry and time.monotonic() - entry[0] < CALENDAR_CACHE_TTL:
+            return entry[1]
+
         async with AsyncSessionLocal() as session:
             result = await session.execute(
                 select(SharedCalendar)
                 .options(selectinload(SharedCalendar.permissions))
                 .where(SharedCalendar.name == calendar_name)
             )
-            return result.scalar_one_or_none()
+            calendar = result.scalar_one_or_none()
+
+        # Misses aren't cached so a newly created calendar is visible immediately
+        if calendar:
+            self._calendar_cache[calendar_name] = (time.monotonic(), calendar)
+        return calendar
 
     async def get_calendar_by_id(self, calendar_id: int) -> Optional[SharedCalendar]:
         """Get calendar by ID"""
@@ -49,18 +80,20 @@ class CalendarManager:
 
     async def delete_calendar(self, calendar_name: str, user_id: int) -> bool:
         """Delete a calendar (only owner can delete)"""
-        async with AsyncSessionLocal() as session:
-            calendar = await self.get_calendar(calendar_name)
-            if not calendar:
-                return False
+        calendar = await self.get_calendar(calendar_name)
+        if not calendar:
+            return False
 
-            # Check if user is owner
-            if not await self.has_permission(calendar.id, user_id, "owner"):
-                return False
+        # Check if user is owner
+        if not await self.has_permission(calendar.id, user_id, "owner"):
+            return False
 
+        # The lookups above use their own sessions, so only open this one for the delete
+        async with AsyncSessionLocal() as session:
             await session.delete(calendar)
             await session.commit()
-            return True
+        self._invalidate_calendar(calendar_id=calendar.id, name=calendar_name)
+        return True
 
     async def add_permission(self, calendar_id: int, user_id: int, permission_level: str, granted_by: int) -> bool:
         """Add or update permission for a user"""
@@ -87,8 +120,44 @@ class CalendarManager:
                 session.add(permission)
 
             await session.commit()
+            # Cached calendars carry their permissions list
+            self._invalidate_calendar(calendar_id=calendar_id)
             return True
 
+    async def add_permissions_bulk(self, calendar_id: int, user_ids: List[int], permission_level: str, granted_by: int) -> List[int]:
+        """Add or update the same permission for many users in a single upsert"""
+        # ON CONFLICT can't touch the same row twice in one statement, so drop duplicate IDs
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return []
+
+        granted_at = datetime.utcnow()
+        stmt = pg_insert(CalendarPermission).values([
+            {
+                "calendar_id": calendar_id,
+                "user_id": user_id,
+                "permission_level": permission_level,
+                "granted_by": granted_by,
+                "granted_at": granted_at
+            }
+            for user_id in user_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_calendar_user_permission",
+            set_={
+                "permission_level": stmt.excluded.permission_level,
+                "granted_by": stmt.excluded.granted_by,
+                "granted_at": stmt.excluded.granted_at
+            }
+        )
+
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(stmt)
+
+        self._invalidate_calendar(calendar_id=calendar_id)
+        return user_ids
+
     async def remove_permission(self, calendar_id: int, user_id: int) -> bool:
         """Remove permission for a user"""
         async with AsyncSessionLocal() as session:
@@ -102,6 +171,7 @@ class CalendarManager:
             if permission:
                 await session.delete(permission)
                 await session.commit()
+                self._invalidate_calendar(calendar_id=calendar_id)
                 return True
             return False
 
@@ -118,12 +188,42 @@ class CalendarManager:
             if not permission:
                 return False
 
-            # Permission hierarchy: owner > writer > reader
-            levels = {"reader": 1, "writer": 2, "owner": 3}
-            user_level = levels.get(permission.permission_level, 0)
-            required_level_value = levels.get(required_level, 0)
+            return self.meets_permission(permission.permission_level, required_level)
 
-            return user_level >= required_level_value
+    @staticmethod
+    def meets_permission(permission_level: Optional[str], required_level: str = "reader") -> bool:
+        """Check a permission level (None when the user has none) against the required level"""
+        if permission_level is None:
+            return False
+        return PERMISSION_LEVELS.get(permission_level, 0) >= PERMISSION_LEVELS.get(required_level, 0)
+
+    async def get_calendar_with_permission(self, calendar_name: str, user_id: int) -> Tuple[Optional[SharedCalendar], Optional[str]]:
+        """Get a calendar by name and the user's permission level on it in one query"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(SharedCalendar, CalendarPermission.permission_level)
+                .outerjoin(CalendarPermission, and_(
+                    CalendarPermission.calendar_id == SharedCalendar.id,
+                    CalendarPermission.user_id == user_id
+                ))
+                .where(SharedCalendar.name == calendar_name)
+            )
+            row = result.first()
+            return (row[0], row[1]) if row else (None, None)
+
+    async def get_event_with_permission(self, event_id: int, user_id: int) -> Tuple[Optional[CalendarEvent], Optional[str]]:
+        """Get an event and the user's permission level on its calendar in one query"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(CalendarEvent, CalendarPermission.permission_level)
+                .outerjoin(CalendarPermission, and_(
+                    CalendarPermission.calendar_id == CalendarEvent.calendar_id,
+                    CalendarPermission.user_id == user_id
+                ))
+                .where(CalendarEvent.id == event_id)
+            )
+            row = result.first()
+            return (row[0], row[1]) if row else (None, None)
 
     async def get_calendar_users(self, calendar_id: int) -> List[CalendarPermission]:
         """Get all users with permissions for a calendar"""
@@ -177,17 +277,21 @@ class CalendarManager:
             return result.scalar_one_or_none()
 
     async def get_calendar_events(self, calendar_id: int, start_date: datetime = None,
-                                 end_date: datetime = None) -> List[CalendarEvent]:
-        """Get events for a calendar within date range"""
+                                 end_date: datetime = None, limit: Optional[int] = None) -> List[CalendarEvent]:
+        """Get events for a calendar within date range, optionally only the first `limit` by start time"""
         async with AsyncSessionLocal() as session:
             query = select(CalendarEvent).where(CalendarEvent.calendar_id == calendar_id)
 
+            # Event times are naive TIMESTAMP columns holding local wall-clock times, so the
+            # bounds must be naive local datetimes too (asyncpg rejects aware ones)
             if start_date:
                 query = query.where(CalendarEvent.end_time >= start_date)
             if end_date:
                 query = query.where(CalendarEvent.start_time <= end_date)
 
             query = query.order_by(CalendarEvent.start_time)
+            if limit is not None:
+                query = query.limit(limit)
 
             result = await session.execute(query)
             return result.scalars().all()
@@ -293,6 +397,30 @@ class CalendarManager:
             await session.commit()
             return True
 
+    async def add_event_attendees_bulk(self, event_id: int, attendees: List[Tuple[int, str]]) -> int:
+        """Add (user_id, role_name) attendees in one insert, skipping existing ones; returns the number added.
+
+        Unlike add_event_attendee this doesn't sync to personal calendars; follow up with
+        sync_event_to_personal_calendars.
+        """
+        # Keep the first role listed for users that appear under several roles
+        rows = {}
+        for user_id, role_name in attendees:
+            rows.setdefault(user_id, role_name)
+        if not rows:
+            return 0
+
+        added_at = datetime.utcnow()
+        stmt = pg_insert(EventAttendee).values([
+            {"event_id": event_id, "user_id": user_id, "role_name": role_name, "added_at": added_at}
+            for user_id, role_name in rows.items()
+        ]).on_conflict_do_nothing(constraint="unique_event_attendee")
+
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                result = await session.execute(stmt)
+        return result.rowcount
+
     async def remove_event_attendee(self, event_id: int, user_id: int) -> bool:
         """Remove attendee from an event"""
         async with AsyncSessionLocal() as session:
@@ -322,16 +450,14 @@ class CalendarManager:
     async def add_users_by_roles(self, calendar_id: int, role_names: List[str], permission_level: str,
                                 granted_by: int, guild_members) -> List[int]:
         """Add users to calendar by their Discord roles"""
-        added_users = []
+        matched_ids = []
 
         for member in guild_members:
             user_roles = [role.name for role in member.roles]
             if any(role_name in user_roles for role_name in role_names):
-                success = await self.add_permission(calendar_id, member.id, permission_level, granted_by)
-                if success:
-                    added_users.append(member.id)
+                matched_ids.append(member.id)
 
-        return added_users
+        return await self.add_permissions_bulk(calendar_id, matched_ids, permission_level, granted_by)
 
     async def remove_users_by_roles(self, calendar_id: int, role_names: List[str], guild_members) -> List[int]:
         """Remove users from calendar by their Discord roles"""
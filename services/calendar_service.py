@@ -3,10 +3,18 @@ from datetime import datetime
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+FREEBUSY_MAX_CALENDARS = 50
+# Seconds a per-user CalendarService (and its HTTP/auth state) is reused before rebuilding
+SERVICE_CACHE_TTL = 300
+
 class CalendarEvent:
+    # One instance per listed event, so skip the per-instance __dict__
+    __slots__ = ("event_id", "title", "start_time", "end_time", "description", "location")
+
     def __init__(self, event_id: str, title: str, start_time: datetime, end_time: datetime, description: str = "", location: str = ""):
         self.event_id = event_id
         self.title = title
@@ -22,17 +30,38 @@ class CalendarService:
 
     def get_freebusy(self, email, start, end):
         """Get free/busy information for a calendar"""
-        try:
+        busy, _ = self.get_freebusy_batch([email], start, end)
+        return busy.get(email, [])
+
+    def get_freebusy_batch(self, emails, start, end):
+        """Get free/busy information for several calendars.
+
+        Returns (busy keyed by calendar ID, IDs of calendars that could not be read).
+        """
+        busy = {}
+        failed = []
+        # The freebusy endpoint accepts a limited number of calendars per query
+        for i in range(0, len(emails), FREEBUSY_MAX_CALENDARS):
+            chunk = emails[i:i + FREEBUSY_MAX_CALENDARS]
             body = {
                 "timeMin": start.isoformat() + "Z",
                 "timeMax": end.isoformat() + "Z",
-                "items": [{"id": email}]
+                "items": [{"id": email} for email in chunk]
             }
-            events_result = self.service.freebusy().query(body=body).execute()
-            return events_result['calendars'][email]['busy']
-        except Exception as e:
-            logger.error(f"Error getting freebusy data: {str(e)}")
-            return []
+            try:
+                calendars = self.service.freebusy().query(body=body).execute()['calendars']
+            except Exception as e:
+                logger.error(f"Error getting freebusy data: {str(e)}")
+                failed.extend(chunk)
+                continue
+            for email in chunk:
+                calendar = calendars.get(email)
+                # Unknown or unshared calendars come back with errors instead of busy times
+                if calendar is None or calendar.get('errors'):
+                    failed.append(email)
+                else:
+                    busy[email] = calendar.get('busy', [])
+        return busy, failed
 
     def create_event(self, calendar_id, title, start, end, description="", location=""):
         """Create event in Google Calendar"""
@@ -173,3 +202,22 @@ class CalendarService:
             logger.error(f"Error adding event to user calendar: {str(e)}")
             return False
 
+# discord_id -> (created_at, token stamp, CalendarService)
+_service_cache = {}
+
+def get_calendar_service(discord_id: int, token_data) -> CalendarService:
+    """Return a CalendarService for a user, reusing a recent instance built from the same token"""
+    now = time.monotonic()
+    # Tokens are written outside the bot (OAuth callback), so a re-linked or refreshed
+    # token is detected by comparing it with the one the cached service was built from
+    stamp = (token_data.get('refresh_token'), token_data.get('token'))
+    entry = _service_cache.get(discord_id)
+    if entry and now - entry[0] < SERVICE_CACHE_TTL and entry[1] == stamp:
+        return entry[2]
+    service = CalendarService(token_data)
+    _service_cache[discord_id] = (now, stamp, service)
+    return service
+
+def invalidate_calendar_service(discord_id: int) -> None:
+    """Drop a user's cached CalendarService, e.g. after their token changes"""
+    _service_cache.pop(discord_id, None)
@@ -1,16 +1,22 @@
 import asyncio
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from enum import Enum
 import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.base import JobLookupError
 from sqlalchemy.future import select
-from sqlalchemy import delete
+from sqlalchemy import delete, update
 
 from db.session import AsyncSessionLocal
 from db.models import Reminder, ReminderTemplate, ReminderLog, ReminderSubscription, Poll
 from utils.stats_module import StatsModule
+from config.config import JOB_DEFAULTS
+
+# Seconds list_templates/list_reminders/get_reminder_logs results are reused; writes drop them sooner
+LIST_CACHE_TTL = 10
 
 class ReminderPriority(Enum):
     INFORMATIONAL = "informational"
@@ -28,12 +34,19 @@ class TargetType(Enum):
     EVENT = "event"
     CUSTOM = "custom"
 
+def reminder_job_id(reminder_id: str) -> str:
+    """Scheduler job ID for a reminder"""
+    return f"reminder_{reminder_id}"
+
 class ReminderManager:
     def __init__(self, bot_client: discord.Client, stats_module: StatsModule):
         self.bot = bot_client
         self.stats_module = stats_module
-        self.scheduler = AsyncIOScheduler()
+        # Jobs live in memory; the Reminder table is the persistent record they are rebuilt from
+        self.scheduler = AsyncIOScheduler(job_defaults=JOB_DEFAULTS)
         self._started = False
+        # (kind, *filters) -> (monotonic time fetched, result) for the read-only list methods
+        self._list_cache = {}
 
         # Priority configurations
         self.priority_configs = {
@@ -79,6 +92,26 @@ class ReminderManager:
             self.scheduler.shutdown()
             self._started = False
 
+    def _cached(self, key):
+        """Return a cached list result that is still fresh, or None"""
+        entry = self._list_cache.get(key)
+        if entry and time.monotonic() - entry[0] < LIST_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _store(self, key, value):
+        """Cache a list result, first dropping entries whose TTL has passed"""
+        now = time.monotonic()
+        for stale_key in [cached_key for cached_key, (cached_at, _) in self._list_cache.items() if now - cached_at >= LIST_CACHE_TTL]:
+            del self._list_cache[stale_key]
+        self._list_cache[key] = (now, value)
+        return value
+
+    def _invalidate(self, *kinds):
+        """Drop cached list results of the given kinds ("templates", "reminders", "logs")"""
+        for key in [key for key in self._list_cache if key[0] in kinds]:
+            del self._list_cache[key]
+
     # ========== Template Management ==========
 
     async def create_template(self, name: str, description: str, message_template: str,
@@ -104,6 +137,7 @@ class ReminderManager:
             session.add(template)
             await session.commit()
             await session.refresh(template)
+            self._invalidate("templates")
             return template
 
     async def get_template(self, template_name: str) -> Optional[ReminderTemplate]:
@@ -116,12 +150,16 @@ class ReminderManager:
 
     async def list_templates(self, creator_id: int = None) -> List[ReminderTemplate]:
         """List all templates, optionally filtered by creator"""
+        key = ("templates", creator_id)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         async with AsyncSessionLocal() as session:
             query = select(ReminderTemplate)
             if creator_id:
                 query = query.where(ReminderTemplate.created_by == creator_id)
             result = await session.execute(query)
-            return result.scalars().all()
+            return self._store(key, result.scalars().all())
 
     # ========== Reminder Creation ==========
 
@@ -181,53 +219,71 @@ class ReminderManager:
         if not template:
             raise ValueError(f"Template '{template_name}' not found")
 
-        async with AsyncSessionLocal() as session:
-            reminder = Reminder(
-                reminder_id=str(uuid.uuid4()),
-                template_id=template.id,
-                target_type=target_type.value,
-                target_id=target_id,
-                channel_id=channel_id,
-                trigger_type=trigger_type.value,
-                created_by=creator_id,
-                custom_data=custom_data or {}
-            )
-
-            # Set trigger-specific fields
-            if trigger_type == TriggerType.SPECIFIC_TIME:
-                reminder.trigger_time = trigger_kwargs.get('trigger_time')
-                reminder.next_trigger = reminder.trigger_time
-            elif trigger_type == TriggerType.TIME_BEFORE:
-                reminder.time_before_minutes = trigger_kwargs.get('minutes_before')
-                # Calculate next trigger based on target
-                await self._calculate_time_before_trigger(reminder)
-            elif trigger_type == TriggerType.INTERVAL:
-                reminder.interval_minutes = trigger_kwargs.get('interval_minutes')
-                reminder.is_recurring = True
-                reminder.max_occurrences = trigger_kwargs.get('max_occurrences')
-                reminder.next_trigger = datetime.utcnow() + timedelta(minutes=reminder.interval_minutes)
+        reminder = self._new_reminder(template, target_type, channel_id, trigger_type,
+                                      creator_id, target_id, custom_data, **trigger_kwargs)
+        if trigger_type == TriggerType.TIME_BEFORE:
+            # Calculate next trigger based on target
+            await self._calculate_time_before_trigger(reminder)
 
+        async with AsyncSessionLocal() as session:
             session.add(reminder)
             await session.commit()
             await session.refresh(reminder)
+            self._invalidate("reminders")
 
             # Schedule the reminder
             await self._schedule_reminder(reminder)
 
             return reminder
 
+    def _new_reminder(self, template: ReminderTemplate, target_type: TargetType,
+                      channel_id: int, trigger_type: TriggerType, creator_id: int,
+                      target_id: str = None, custom_data: Dict[str, Any] = None,
+                      **trigger_kwargs) -> Reminder:
+        """Build an unsaved reminder; time_before reminders still need their next trigger set"""
+        reminder = Reminder(
+            reminder_id=str(uuid.uuid4()),
+            template_id=template.id,
+            target_type=target_type.value,
+            target_id=target_id,
+            channel_id=channel_id,
+            trigger_type=trigger_type.value,
+            created_by=creator_id,
+            custom_data=custom_data or {}
+        )
+
+        # Set trigger-specific fields
+        if trigger_type == TriggerType.SPECIFIC_TIME:
+            reminder.trigger_time = trigger_kwargs.get('trigger_time')
+            reminder.next_trigger = reminder.trigger_time
+        elif trigger_type == TriggerType.TIME_BEFORE:
+            reminder.time_before_minutes = trigger_kwargs.get('minutes_before')
+        elif trigger_type == TriggerType.INTERVAL:
+            reminder.interval_minutes = trigger_kwargs.get('interval_minutes')
+            reminder.is_recurring = True
+            reminder.max_occurrences = trigger_kwargs.get('max_occurrences')
+            reminder.next_trigger = datetime.utcnow() + timedelta(minutes=reminder.interval_minutes)
+        return reminder
+
+    @staticmethod
+    def _time_before_trigger(expires_at: Optional[datetime], minutes_before: int) -> Optional[datetime]:
+        """When a reminder minutes_before expires_at should fire, or None if that is already past"""
+        if expires_at:
+            trigger_time = expires_at - timedelta(minutes=minutes_before)
+            if trigger_time > datetime.utcnow():
+                return trigger_time
+        return None
+
     async def _calculate_time_before_trigger(self, reminder: Reminder):
         """Calculate when to trigger a time_before reminder"""
         if reminder.target_type == TargetType.POLL.value and reminder.target_id:
             async with AsyncSessionLocal() as session:
                 result = await session.execute(
-                    select(Poll).where(Poll.poll_id == reminder.target_id)
+                    select(Poll.expires_at).where(Poll.poll_id == reminder.target_id)
                 )
-                poll = result.scalar_one_or_none()
-                if poll and poll.expires_at:
-                    trigger_time = poll.expires_at - timedelta(minutes=reminder.time_before_minutes)
-                    if trigger_time > datetime.utcnow():
-                        reminder.next_trigger = trigger_time
+                trigger_time = self._time_before_trigger(result.scalar_one_or_none(), reminder.time_before_minutes)
+                if trigger_time:
+                    reminder.next_trigger = trigger_time
 
     # ========== Reminder Scheduling ==========
 
@@ -236,7 +292,7 @@ class ReminderManager:
         if not reminder.next_trigger or reminder.next_trigger <= datetime.utcnow():
             return
 
-        job_id = f"reminder_{reminder.reminder_id}"
+        job_id = reminder_job_id(reminder.reminder_id)
 
         self.scheduler.add_job(
             self._execute_reminder,
@@ -258,8 +314,8 @@ class ReminderManager:
             )
             reminders = result.scalars().all()
 
-            for reminder in reminders:
-                await self._schedule_reminder(reminder)
+        for reminder in reminders:
+            await self._schedule_reminder(reminder)
 
     async def _check_pending_reminders(self):
         """Check for any reminders that might have been missed"""
@@ -273,10 +329,11 @@ class ReminderManager:
                         Reminder.next_trigger > now - timedelta(minutes=5)
                     )
                 )
-                missed_reminders = result.scalars().all()
+                missed_ids = [reminder.reminder_id for reminder in result.scalars().all()]
 
-                for reminder in missed_reminders:
-                    await self._execute_reminder(reminder.reminder_id)
+            # _execute_reminder opens its own session, so release this one first
+            for reminder_id in missed_ids:
+                await self._execute_reminder(reminder_id)
         except Exception as e:
             print(f"Error checking pending reminders: {e}")
 
@@ -330,6 +387,7 @@ class ReminderManager:
                     reminder.is_active = False
 
                 await session.commit()
+                self._invalidate("reminders")
 
                 # Log success
                 await self._log_reminder(reminder_id, 'sent', None, message_content['text'])
@@ -449,33 +507,35 @@ class ReminderManager:
             )
             session.add(log)
             await session.commit()
+        self._list_cache.pop(("logs", reminder_id), None)
 
     # ========== Management Methods ==========
 
     async def cancel_reminder(self, reminder_id: str) -> bool:
-        """Cancel a specific reminder"""
+        """Cancel a specific reminder and remove its scheduled job"""
         async with AsyncSessionLocal() as session:
             result = await session.execute(
-                select(Reminder).where(Reminder.reminder_id == reminder_id)
+                update(Reminder).where(Reminder.reminder_id == reminder_id).values(is_active=False)
             )
-            reminder = result.scalar_one_or_none()
-
-            if not reminder:
+            if result.rowcount == 0:
                 return False
-
-            reminder.is_active = False
             await session.commit()
+        self._invalidate("reminders")
 
-            # Remove from scheduler
-            try:
-                self.scheduler.remove_job(f"reminder_{reminder_id}")
-            except:
-                pass
+        # Drop the job now rather than letting it fire and skip the inactive reminder
+        try:
+            self.scheduler.remove_job(reminder_job_id(reminder_id))
+        except JobLookupError:
+            pass  # Already fired, or never scheduled
 
-            return True
+        return True
 
     async def list_reminders(self, creator_id: int = None, is_active: bool = None) -> List[Reminder]:
         """List reminders with optional filters"""
+        key = ("reminders", creator_id, is_active)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         async with AsyncSessionLocal() as session:
             query = select(Reminder)
 
@@ -485,47 +545,66 @@ class ReminderManager:
                 query = query.where(Reminder.is_active == is_active)
 
             result = await session.execute(query)
-            return result.scalars().all()
+            return self._store(key, result.scalars().all())
 
     async def get_reminder_logs(self, reminder_id: str) -> List[ReminderLog]:
         """Get execution logs for a reminder"""
+        key = ("logs", reminder_id)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         async with AsyncSessionLocal() as session:
             result = await session.execute(
                 select(ReminderLog).where(ReminderLog.reminder_id == reminder_id)
                 .order_by(ReminderLog.triggered_at.desc())
             )
-            return result.scalars().all()
+            return self._store(key, result.scalars().all())
 
     # ========== Convenience Methods for Poll Reminders ==========
 
     async def setup_poll_reminders(self, poll_id: str, channel_id: int, creator_id: int,
                                   reminders_config: List[Dict[str, Any]]):
-        """Setup multiple reminders for a poll at once"""
-        created_reminders = []
+        """Setup multiple reminders for a poll at once, saving them in one transaction"""
+        # Look up every referenced template and the poll's expiry once for the whole batch
+        template_names = {config['template'] for config in reminders_config}
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(ReminderTemplate).where(ReminderTemplate.name.in_(template_names))
+            )
+            templates = {template.name: template for template in result.scalars().all()}
+            result = await session.execute(select(Poll.expires_at).where(Poll.poll_id == poll_id))
+            expires_at = result.scalar_one_or_none()
 
+        created_reminders = []
         for config in reminders_config:
             try:
+                template = templates.get(config['template'])
+                if not template:
+                    raise ValueError(f"Template '{config['template']}' not found")
                 if config['type'] == 'time_before':
-                    reminder = await self.create_poll_reminder(
-                        poll_id=poll_id,
-                        template_name=config['template'],
-                        trigger_type=TriggerType.TIME_BEFORE,
-                        channel_id=channel_id,
-                        creator_id=creator_id,
-                        minutes_before=config['minutes_before']
+                    reminder = self._new_reminder(
+                        template, TargetType.POLL, channel_id, TriggerType.TIME_BEFORE, creator_id,
+                        target_id=poll_id, minutes_before=config['minutes_before']
                     )
+                    reminder.next_trigger = self._time_before_trigger(expires_at, reminder.time_before_minutes)
                 elif config['type'] == 'interval':
-                    reminder = await self.create_poll_reminder(
-                        poll_id=poll_id,
-                        template_name=config['template'],
-                        trigger_type=TriggerType.INTERVAL,
-                        channel_id=channel_id,
-                        creator_id=creator_id,
-                        interval_minutes=config['interval_minutes'],
+                    reminder = self._new_reminder(
+                        template, TargetType.POLL, channel_id, TriggerType.INTERVAL, creator_id,
+                        target_id=poll_id, interval_minutes=config['interval_minutes'],
                         max_occurrences=config.get('max_occurrences')
                     )
+                else:
+                    continue
                 created_reminders.append(reminder)
             except Exception as e:
                 print(f"Failed to create reminder: {e}")
 
+        if created_reminders:
+            async with AsyncSessionLocal() as session:
+                session.add_all(created_reminders)
+                await session.commit()
+            self._invalidate("reminders")
+            for reminder in created_reminders:
+                await self._schedule_reminder(reminder)
+
         return created_reminders
\ No newline at end of file
@@ -0,0 +1,24 @@
+import functools
+import logging
+import time
+import discord
+
+logger = logging.getLogger(__name__)
+
+def require_defer(func):
+    """Acknowledge the interaction before running a handler that does slow (DB/API) work.
+
+    Discord drops interactions that aren't acknowledged within 3 seconds. The wrapped
+    handler must reply through ``interaction.followup`` instead of ``interaction.response``.
+    """
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        started = time.perf_counter()
+        await interaction.response.defer(ephemeral=True)
+        defer_ms = (time.perf_counter() - started) * 1000
+        try:
+            return await func(interaction, *args, **kwargs)
+        finally:
+            total_ms = (time.perf_counter() - started) * 1000
+            logger.debug("%s: defer=%.0fms total=%.0fms", func.__name__, defer_ms, total_ms)
+    return wrapper
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+import discord
+
+class DiscordApiBackoff(Exception):
+    """Raised when a Discord API call is still rate limited after one retry"""
+
+    def __init__(self, route: str, retry_after: float):
+        super().__init__(f"Discord API route '{route}' is rate limited, retry after {retry_after:.1f}s")
+        self.route = route
+        self.retry_after = retry_after
+
+class TokenBucket:
+    # The limiter keeps one bucket per route for the life of the bot
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class DiscordLimiter:
+    """Client-side token buckets (one global, one per route) for bursty Discord API work"""
+
+    def __init__(self, global_rate: float = 50, route_rate: float = 5, route_capacity: int = 5):
+        self.global_bucket = TokenBucket(global_rate, int(global_rate))
+        self.route_rate = route_rate
+        self.route_capacity = route_capacity
+        self.route_buckets: Dict[str, TokenBucket] = {}
+
+    async def acquire(self, route: str) -> None:
+        bucket = self.route_buckets.get(route)
+        if bucket is None:
+            bucket = self.route_buckets[route] = TokenBucket(self.route_rate, self.route_capacity)
+        await bucket.acquire()
+        await self.global_bucket.acquire()
+
+    async def call(self, route: str, request: Callable[[], Awaitable]):
+        """Run request under the route's bucket, retrying once if Discord answers 429"""
+        await self.acquire(route)
+        try:
+            return await request()
+        except (discord.RateLimited, discord.HTTPException) as e:
+            retry_after = _retry_after(e)
+            if retry_after is None:
+                raise
+
+        await asyncio.sleep(retry_after)
+        await self.acquire(route)
+        try:
+            return await request()
+        except (discord.RateLimited, discord.HTTPException) as e:
+            retry_after = _retry_after(e)
+            if retry_after is None:
+                raise
+            raise DiscordApiBackoff(route, retry_after) from e
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds to wait for a rate-limit error, or None if error is not a 429"""
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if getattr(error, 'status', None) != 429:
+        return None
+    response = getattr(error, 'response', None)
+    header = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return float(header) if header else 1.0
+    except ValueError:
+        return 1.0
@@ -1,11 +1,14 @@
 from db.models import UserProfile, Vote
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from datetime import datetime
 
+# Votes and polls are persisted in the database; these in-memory logs only keep recent activity
+USAGE_LOG_LIMIT = 1000
+
 class StatsModule:
     def __init__(self):
-        self.usage_logs = []  # List of dicts: {'user_id', 'action', 'details', 'timestamp'}
-        self.votes = []  # List of Vote objects
+        self.usage_logs = deque(maxlen=USAGE_LOG_LIMIT)  # Dicts: {'user_id', 'action', 'details', 'timestamp'}
+        self.votes = deque(maxlen=USAGE_LOG_LIMIT)  # Vote objects
         self.poll_creations = defaultdict(int)  # user_id -> count
 
     def log_usage(self, user_id: int, action: str, details: dict = None):
@@ -28,10 +31,7 @@ class StatsModule:
         self.log_usage(user_id, 'vote', {'poll_id': poll_id})
 
     def top_voters(self, n=5):
-        count = defaultdict(int)
-        for vote in self.votes:
-            count[vote.user_id] += 1
-        return sorted(count.items(), key=lambda x: x[1], reverse=True)[:n]
+        return Counter(vote.user_id for vote in self.votes).most_common(n)
 
     def top_poll_creators(self, n=5):
         return sorted(self.poll_creations.items(), key=lambda x: x[1], reverse=True)[:n]